@@ -4,395 +4,580 @@ Fixed CLI Command Handler - All Import Issues Resolved
 Matches exactly with the actual function names in the analyzer modules
 """
 
-import argparse
-from pathlib import Path
-from typing import Dict, Any
-import json
+from __future__ import annotations
+
+import functools
+import importlib
+import sys
+from collections import Counter
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse  # Imported lazily at runtime, in _create_parser
+
+
+# Analyzer modules imported on first use, keyed by dotted path
+_MODULES = {}
+
+
+def _lazy(path: str):
+    """Import an analyzer module on first use and cache it."""
+    module = _MODULES.get(path)
+    if module is None:
+        module = _MODULES[path] = importlib.import_module(path)
+    return module
+
+
+# json is only needed for --json output; bound on first use
+_json = None
+
+
+def _get_json():
+    """Import json on first use and cache the module."""
+    global _json
+    if _json is None:
+        import json
+        _json = json
+    return _json
+
+
+# Path arguments that always name the current directory
+_CWD_SPELLINGS = frozenset((".", ""))
+
+
+@functools.lru_cache(maxsize=32)
+def _existing_path(path: str) -> str:
+    """Return the normalized form of path once it is known to exist.
+    
+    Failed lookups raise and so are never cached. The current directory
+    (the git hook default, also spelled '') always exists and skips the
+    stat() entirely.
+    """
+    from pathlib import Path
+    
+    path_obj = Path(path)
+    if path not in _CWD_SPELLINGS:
+        path_obj.stat()
+    return str(path_obj)
+
+
+# JSON keys for issue objects and the attributes that fill them, in order
+_ISSUE_JSON_KEYS = ('file', 'line', 'type', 'message', 'severity')
+_issue_fields = attrgetter('file_path', 'line_number', 'issue_type', 'message', 'severity')
+_SECURITY_JSON_KEYS = ('file', 'line', 'type', 'message', 'severity', 'cwe_id')
+_security_fields = attrgetter('file', 'line', 'type', 'message', 'severity', 'cwe_id')
+
+
+def _issue_rows(keys: tuple[str, ...], fields, issues) -> list[dict]:
+    """Convert issue objects to JSON dicts with one attrgetter call each."""
+    return [dict(zip(keys, row)) for row in map(fields, issues)]
+
+
+# Large write buffer so multi-MB reports are flushed in a few big writes
+_SAVE_BUFFER_SIZE = 1 << 17
+
+
+def _stdout_bytes():
+    """Return stdout's binary buffer when text can go there as UTF-8 bytes."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        return None
+    sys.stdout.flush()
+    return buffer
+
+
+def _guarded(unavailable: str, failed: str, icon: str = "❌", exit_code: int = 1):
+    """Wrap a command's execute() with the shared ImportError/Exception handling."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(cls, args) -> int:
+            try:
+                return fn(cls, args)
+            except ImportError as e:
+                print(f"{icon} {unavailable}: {e}")
+                return exit_code
+            except Exception as e:
+                print(f"{icon} {failed}: {e}")
+                return exit_code
+        return wrapper
+    return decorator
+
+
+# Team report lookups
+_STATUS_ICONS = MappingProxyType({"ready": "✅", "caution": "⚠️", "blocked": "🚫"})
+_TEAM_EXIT_CODES = MappingProxyType({"blocked": 2, "caution": 1})
+# Shared read-only default for missing nested report sections
+_EMPTY = MappingProxyType({})
+
+
+# Analysis modes (flag, help) - only one may be given per invocation
+_MODES = (
+    ("--analyze", "Basic code analysis"),
+    ("--security", "Security scan"),
+    ("--comprehensive", "Full analysis"),
+    ("--legacy", "Legacy codebase analysis"),
+    ("--team", "Team collaboration check"),
+    ("--install-hooks", "Install git hooks"),
+    ("--pre-commit", "Pre-commit hook analysis (internal)"),
+)
+_MODE_FLAGS = frozenset(flag for flag, _ in _MODES)
+_HELP_FLAGS = frozenset(("-h", "--help"))
+# Boolean output switches understood by the hand-rolled fast path -> dest
+_FAST_SWITCHES = {"--json": "json", "--verbose": "verbose", "-v": "verbose"}
 
 
 class CLIHandler:
     """Handles CLI commands and routes to appropriate analyzers."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @staticmethod
+    def execute(args: list[str]) -> int:
         """Main CLI execution - simple routing."""
-        parser = self._create_parser()
+        mode = CLIHandler._sniff_mode(args)
+        parsed = CLIHandler._fast_parse(mode, args) if mode is not None else None
+        parser = CLIHandler._create_parser(mode) if parsed is None else None
         
         try:
-            parsed = parser.parse_args(args)
-            return self._route_command(parsed)
+            if parsed is None:
+                parsed = parser.parse_args(args)
+            if mode is not None:
+                return _COMMANDS[mode].execute(parsed)
+            
+            # Full parser: route on the first mode attribute that was given
+            for name, command_cls in _ROUTES:
+                if getattr(parsed, name, None):
+                    return command_cls.execute(parsed)
+            
+            print("❌ No command specified. Use --help for options.")
+            return 1
         except Exception as e:
             print(f"❌ Error: {e}")
             return 1
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser."""
-        parser = argparse.ArgumentParser(
-            description="Enhanced Code Analyzer CLI",
-            formatter_class=argparse.RawDescriptionHelpFormatter
+    @staticmethod
+    def _sniff_mode(args: list[str]) -> str | None:
+        """Find the single mode flag in args, or None if the full parser is needed."""
+        found = None
+        for token in args:
+            flag = token.split("=", 1)[0]
+            if flag in _HELP_FLAGS:
+                return None
+            if flag in _MODE_FLAGS:
+                if found is not None:
+                    return None  # Let the full parser report the conflict
+                found = flag
+        return found
+    
+    @staticmethod
+    def _fast_parse(mode: str, args: list[str]) -> SimpleNamespace | None:
+        """Parse the common '--mode PATH [--json] [--save FILE] [-v]' form by hand.
+        
+        Anything else (abbreviations, repeated values, bad tokens) returns
+        None so argparse can handle it and report errors as usual.
+        """
+        values = {mode: None, "--save": None, "--jobs": None}
+        switches = {"json": False, "verbose": False}
+        tokens = iter(args)
+        for token in tokens:
+            flag, eq, value = token.partition("=")
+            if flag in values:
+                if values[flag] is not None:
+                    return None  # Repeated value
+                if not eq:
+                    value = next(tokens, None)
+                    if value is None or value.startswith("-"):
+                        return None
+                values[flag] = value
+            elif token in _FAST_SWITCHES:
+                switches[_FAST_SWITCHES[token]] = True
+            else:
+                return None
+        
+        jobs = values["--jobs"]
+        if jobs is not None:
+            try:
+                jobs = int(jobs)
+            except ValueError:
+                return None
+        
+        return SimpleNamespace(
+            **{mode[2:].replace("-", "_"): values[mode]},
+            save=values["--save"],
+            jobs=jobs,
+            **switches
         )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _create_parser(mode: str | None = None) -> argparse.ArgumentParser:
+        """Create the argument parser, limited to one mode when it is known.
         
-        # Analysis modes (mutually exclusive)
-        mode_group = parser.add_mutually_exclusive_group()
-        mode_group.add_argument("--analyze", metavar="PATH", help="Basic code analysis")
-        mode_group.add_argument("--security", metavar="PATH", help="Security scan")
-        mode_group.add_argument("--comprehensive", metavar="PATH", help="Full analysis")
-        mode_group.add_argument("--legacy", metavar="PATH", help="Legacy codebase analysis")
-        mode_group.add_argument("--team", metavar="PATH", help="Team collaboration check")
-        mode_group.add_argument("--install-hooks", metavar="PATH", help="Install git hooks")
-        mode_group.add_argument("--pre-commit", metavar="PATH", help="Pre-commit hook analysis (internal)")
+        Parsers are cached per mode so repeated in-process calls (hooks, tests)
+        reuse them; parse_args() does not mutate the parser.
+        """
+        import argparse
+        
+        parser = argparse.ArgumentParser(description="Enhanced Code Analyzer CLI")
+        
+        if mode is None:
+            # Analysis modes (mutually exclusive)
+            mode_group = parser.add_mutually_exclusive_group()
+            for flag, help_text in _MODES:
+                mode_group.add_argument(flag, metavar="PATH", help=help_text)
+        else:
+            parser.add_argument(mode, metavar="PATH", help=dict(_MODES)[mode])
         
         # Output options
         parser.add_argument("--json", action="store_true", help="JSON output")
         parser.add_argument("--save", metavar="FILE", help="Save to file")
         parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+        parser.add_argument("--jobs", metavar="N", type=int,
+                            help="Worker processes for --comprehensive")
         
         return parser
-    
-    def _route_command(self, args) -> int:
-        """Route to the appropriate command handler."""
-        if args.analyze:
-            return BasicAnalysisCommand().execute(args)
-        elif args.security:
-            return SecurityAnalysisCommand().execute(args)
-        elif args.comprehensive:
-            return ComprehensiveAnalysisCommand().execute(args)
-        elif args.legacy:
-            return LegacyAnalysisCommand().execute(args)
-        elif args.team:
-            return TeamAnalysisCommand().execute(args)
-        elif args.install_hooks:
-            return InstallHooksCommand().execute(args)
-        elif args.pre_commit:
-            return PreCommitCommand().execute(args)
-        else:
-            print("❌ No command specified. Use --help for options.")
-            return 1
 
 
 class BaseCommand:
     """Base class for all CLI commands."""
     
-    def validate_path(self, path: str) -> Path:
-        """Validate and return Path object."""
-        path_obj = Path(path)
-        if not path_obj.exists():
-            raise ValueError(f"Directory '{path}' does not exist")
-        return path_obj
+    __slots__ = ()
+    
+    @classmethod
+    def validate_path(cls, path: str) -> str:
+        """Validate path and return it normalized, stat()ing each path at most once."""
+        try:
+            return _existing_path(path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"Directory '{path}' does not exist") from None
     
-    def save_results(self, content: str, save_path: str) -> None:
-        """Save results to file."""
+    @classmethod
+    def save_results(cls, content: str | bytes, save_path: str) -> None:
+        """Save results to file in a single write."""
+        from pathlib import Path
+        
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            Path(save_path).write_bytes(content)
             print(f"💾 Report saved to: {save_path}")
         except Exception as e:
             print(f"❌ Save failed: {e}")
+    
+    @classmethod
+    def emit_text(cls, output: str, save_path: str | None = None, preamble: str = "") -> None:
+        """Print a text report (after an optional preamble) and save it.
+        
+        The report is encoded once and the same bytes go to stdout and the
+        save file; stdout falls back to text writes when it is not UTF-8.
+        """
+        encoded = output.encode('utf-8')
+        buffer = _stdout_bytes()
+        if buffer is None:
+            sys.stdout.write(preamble + output + "\n")
+        else:
+            buffer.write(preamble.encode('utf-8') + encoded + b"\n")
+            buffer.flush()
+        
+        if save_path:
+            cls.save_results(encoded, save_path)
+    
+    @classmethod
+    def save_results_stream(cls, writer_fn, save_path: str) -> None:
+        """Save results by letting writer_fn write straight into the open file."""
+        try:
+            with open(save_path, 'w', encoding='utf-8', buffering=_SAVE_BUFFER_SIZE) as f:
+                writer_fn(f)
+            print(f"💾 Report saved to: {save_path}")
+        except Exception as e:
+            print(f"❌ Save failed: {e}")
+    
+    @classmethod
+    def emit_json(cls, data: object, save_path: str | None = None, **encoder_kwargs) -> None:
+        """Stream JSON to stdout (and the save file) without building the full string.
+        
+        Output is compact unless stdout is a terminal, where it stays indented
+        for reading; saved files are always compact.
+        """
+        json = _get_json()
+        compact = json.JSONEncoder(separators=(',', ':'), **encoder_kwargs)
+        isatty = getattr(sys.stdout, "isatty", None)
+        if isatty is not None and isatty():
+            encoder = json.JSONEncoder(indent=2, **encoder_kwargs)
+        else:
+            encoder = compact
+        
+        # iterencode yields small chunks; writelines hands them to the buffered stream
+        sys.stdout.writelines(encoder.iterencode(data))
+        sys.stdout.write("\n")
+        
+        if save_path:
+            cls.save_results_stream(
+                lambda f: f.writelines(compact.iterencode(data)), save_path
+            )
 
 
 class BasicAnalysisCommand(BaseCommand):
     """Handles basic code analysis - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Code analyzer module not available", "Analysis failed")
+    def execute(cls, args) -> int:
         """Execute basic analysis."""
-        try:
-            project_path = self.validate_path(args.analyze)
-            print(f"🔍 Running basic analysis on: {project_path}")
-            
-            # FIXED: Use the correct function names from code_analyzer.py
-            from functions.code_analyzer import analyze_project, format_summary
-            
-            results = analyze_project(str(project_path))
-            
-            if args.json:
-                # Convert issues to dict for JSON serialization
-                json_results = {
-                    'issues': [
-                        {
-                            'file': issue.file,
-                            'line': issue.line,
-                            'type': issue.type,
-                            'message': issue.message,
-                            'severity': issue.severity
-                        } for issue in results.get('issues', [])
-                    ],
-                    'stats': results.get('stats', {}),
-                    'project_path': results.get('project_path', ''),
-                    'files_analyzed': results.get('files_analyzed', 0)
-                }
-                output = json.dumps(json_results, indent=2)
-            else:
-                # FIXED: Use format_summary instead of summarize_results
-                output = format_summary(results)
-            
-            print(output)
-            
-            if args.save:
-                self.save_results(output, args.save)
-            
-            # Return exit code based on issues
-            issues = results.get('issues', [])
-            errors = [i for i in issues if getattr(i, 'severity', 'info') == 'error']
-            return 1 if errors else 0
-            
-        except ImportError as e:
-            print(f"❌ Code analyzer module not available: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Analysis failed: {e}")
-            return 1
+        project_path = cls.validate_path(args.analyze)
+        print(f"🔍 Running basic analysis on: {project_path}")
+        
+        code_analyzer = _lazy("functions.code_analyzer")
+        
+        results = code_analyzer.analyze_project(project_path)
+        severity_counts = code_analyzer.count_by_severity(results.get('issues', []))
+        
+        if args.json:
+            # Convert issues to dict for JSON serialization
+            json_results = {
+                'issues': _issue_rows(_ISSUE_JSON_KEYS, _issue_fields, results.get('issues', [])),
+                'stats': results.get('stats', {}),
+                'project_path': results.get('project_path', ''),
+                'files_analyzed': results.get('files_analyzed', 0)
+            }
+            cls.emit_json(json_results, args.save)
+        else:
+            output = code_analyzer.format_summary(results, severity_counts)
+            cls.emit_text(output, args.save)
+        
+        # Return exit code based on issues
+        return 1 if severity_counts['error'] else 0
 
 
 class SecurityAnalysisCommand(BaseCommand):
     """Handles security analysis - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Security scanner not available", "Security analysis failed")
+    def execute(cls, args) -> int:
         """Execute security analysis."""
-        try:
-            project_path = self.validate_path(args.security)
-            print(f"🔒 Running security analysis on: {project_path}")
-            
-            # FIXED: Use correct imports from security_scanner.py
-            from functions.security_scanner import SecurityScanner, create_security_report
-            
-            scanner = SecurityScanner()
-            results = scanner.scan_project(str(project_path))
-            
-            if args.json:
-                # Convert SecurityIssue objects to dicts for JSON
-                json_results = dict(results)
-                json_results['security_issues'] = [
-                    {
-                        'file': issue.file,
-                        'line': issue.line,
-                        'type': issue.type,
-                        'message': issue.message,
-                        'severity': issue.severity,
-                        'cwe_id': issue.cwe_id
-                    } for issue in results.get('security_issues', [])
-                ]
-                output = json.dumps(json_results, indent=2)
-            else:
-                output = create_security_report(results)
-            
-            print(output)
-            
-            if args.save:
-                self.save_results(output, args.save)
-            
-            # Exit code based on security findings
-            critical_count = results.get('vulnerability_counts', {}).get('critical', 0)
-            high_count = results.get('vulnerability_counts', {}).get('high', 0)
-            
-            if critical_count > 0:
-                return 2
-            elif high_count > 0:
-                return 1
-            else:
-                return 0
-                
-        except ImportError as e:
-            print(f"❌ Security scanner not available: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Security analysis failed: {e}")
-            return 1
+        project_path = cls.validate_path(args.security)
+        print(f"🔒 Running security analysis on: {project_path}")
+        
+        security_scanner = _lazy("functions.security_scanner")
+        
+        scanner = security_scanner.SecurityScanner()
+        results = scanner.scan_project(project_path)
+        
+        if args.json:
+            # Convert SecurityIssue objects to dicts for JSON
+            json_results = dict(results)
+            json_results['security_issues'] = _issue_rows(
+                _SECURITY_JSON_KEYS, _security_fields, results.get('security_issues', [])
+            )
+            cls.emit_json(json_results, args.save)
+        else:
+            output = security_scanner.create_security_report(results)
+            cls.emit_text(output, args.save)
+        
+        # Exit code based on security findings
+        counts = results.get('vulnerability_counts') or _EMPTY
+        if counts.get('critical'):
+            return 2
+        return 1 if counts.get('high') else 0
 
 
 class ComprehensiveAnalysisCommand(BaseCommand):
     """Handles comprehensive analysis - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Module not available", "Comprehensive analysis failed")
+    def execute(cls, args) -> int:
         """Execute comprehensive analysis."""
-        try:
-            project_path = self.validate_path(args.comprehensive)
-            print(f"🚀 Running comprehensive analysis on: {project_path}")
-            
-            # FIXED: Use the analysis controller instead of direct imports
-            from functions.analysis_controller import AnalysisController
-            
-            controller = AnalysisController()
-            
-            # Define enabled modules for comprehensive analysis
-            enabled_modules = {
-                'code_analyzer': True,
-                'security_scanner': True,
-                'dependency_analyzer': True,
-                'codebase_discovery': False,  # Optional
-                'git_integration': False      # Optional
-            }
-            
-            # Run analysis
-            results = controller.run_analysis_sync(str(project_path), enabled_modules)
-            
-            if args.json:
-                output = results.to_json()
-            else:
-                output = self._format_comprehensive_report(results)
-            
-            print(output)
-            
-            if args.save:
-                self.save_results(output, args.save)
-            
-            return self._calculate_exit_code(results)
-            
-        except ImportError as e:
-            print(f"❌ Module not available: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Comprehensive analysis failed: {e}")
-            return 1
+        project_path = cls.validate_path(args.comprehensive)
+        print(f"🚀 Running comprehensive analysis on: {project_path}")
+        
+        controller_module = _lazy("functions.analysis_controller")
+        controller = controller_module.AnalysisController()
+        
+        # Define enabled modules for comprehensive analysis
+        enabled_modules = {
+            'code_analyzer': True,
+            'security_scanner': True,
+            'dependency_analyzer': True,
+            'codebase_discovery': False,  # Optional
+            'git_integration': False      # Optional
+        }
+        
+        # Run the independent analyses concurrently (threads by default,
+        # processes with --jobs), collecting progress so it goes out
+        # together with the report in a single write
+        progress_lines = []
+        
+        def progress(msg: str):
+            progress_lines.append(f"Progress: {msg}")
+        
+        if args.jobs and args.jobs > 1:
+            results = controller.run_analysis_parallel(
+                project_path, enabled_modules, max_workers=args.jobs,
+                progress_callback=progress
+            )
+        else:
+            results = controller.run_analysis_sync(
+                project_path, enabled_modules, max_workers=3,
+                progress_callback=progress
+            )
+        
+        # One pass over the issues serves both the report and the exit code
+        severity_counts, exit_code = cls._summarize(results.issues if results.success else ())
+        
+        if args.json:
+            sys.stdout.write("\n".join(progress_lines) + "\n")
+            cls.emit_json(results.to_dict(), args.save, default=controller_module.json_default)
+        else:
+            output = cls._format_comprehensive_report(results, severity_counts)
+            preamble = "".join(line + "\n" for line in progress_lines)
+            cls.emit_text(output, args.save, preamble)
+        
+        return exit_code if results.success else 1
     
-    def _format_comprehensive_report(self, results) -> str:
+    @classmethod
+    def _summarize(cls, issues) -> tuple[Counter, int]:
+        """Tally issues by severity and derive the exit code in a single pass.
+        
+        The exit code follows the first critical (2) or error (1) issue.
+        """
+        severity_counts = Counter()
+        exit_code = None
+        for issue in issues:
+            try:
+                severity = issue.severity
+            except AttributeError:  # every analyzer's issue type defines it
+                severity = 'unknown'
+            severity_counts[severity] += 1
+            if exit_code is None:
+                if severity == 'critical':
+                    exit_code = 2
+                elif severity == 'error':
+                    exit_code = 1
+        return severity_counts, exit_code or 0
+    
+    @classmethod
+    def _format_comprehensive_report(cls, results, severity_counts: Counter) -> str:
         """Format comprehensive results."""
-        lines = []
-        lines.append("🚀 COMPREHENSIVE ANALYSIS REPORT")
-        lines.append("=" * 50)
+        header = ["🚀 COMPREHENSIVE ANALYSIS REPORT", "=" * 50]
         
         if not results.success:
-            lines.append(f"❌ Analysis failed: {results.error_message}")
-            return "\n".join(lines)
+            header.append(f"❌ Analysis failed: {results.error_message}")
+            return "\n".join(header)
         
         # Summary
-        lines.append(f"📊 Total Issues: {len(results.issues)}")
-        lines.append(f"🔧 Modules Used: {', '.join(results.modules_used or [])}")
-        lines.append("")
+        lines = [
+            *header,
+            f"📊 Total Issues: {len(results.issues)}",
+            f"🔧 Modules Used: {', '.join(results.modules_used or [])}",
+            "",
+        ]
         
         # Issue breakdown by severity
         if results.issues:
-            severity_counts = {}
-            for issue in results.issues:
-                severity = getattr(issue, 'severity', 'unknown')
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-            
             lines.append("📋 ISSUE BREAKDOWN:")
-            for severity, count in severity_counts.items():
-                lines.append(f"  • {severity.title()}: {count}")
+            lines.extend(f"  • {severity.title()}: {count}" for severity, count in severity_counts.items())
         else:
             lines.append("🎉 No issues found!")
         
         return "\n".join(lines)
-    
-    def _calculate_exit_code(self, results) -> int:
-        """Calculate exit code based on all results."""
-        if not results.success:
-            return 1
-        
-        # Check for critical issues
-        for issue in results.issues:
-            severity = getattr(issue, 'severity', 'info')
-            if severity == 'critical':
-                return 2
-            elif severity == 'error':
-                return 1
-                
-        return 0
 
 
 class LegacyAnalysisCommand(BaseCommand):
     """Handles codebase discovery analysis - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Codebase discovery not available", "Codebase discovery failed")
+    def execute(cls, args) -> int:
         """Execute codebase discovery analysis."""
-        try:
-            project_path = self.validate_path(args.legacy)
-            print(f"🗺️ Running codebase discovery on: {project_path}")
-            
-            # FIXED: Use correct imports from codebase_discovery.py
-            from functions.codebase_discovery import analyze_codebase, create_discovery_report
-            
-            results = analyze_codebase(str(project_path))
-            
-            if args.json:
-                from dataclasses import asdict
-                output = json.dumps(asdict(results), indent=2, default=str)
-            else:
-                output = create_discovery_report(results)
-            
-            print(output)
-            
-            if args.save:
-                self.save_results(output, args.save)
-            
-            return 0  # Discovery analysis doesn't have error conditions
-            
-        except ImportError as e:
-            print(f"❌ Codebase discovery not available: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Codebase discovery failed: {e}")
-            return 1
+        project_path = cls.validate_path(args.legacy)
+        print(f"🗺️ Running codebase discovery on: {project_path}")
+        
+        codebase_discovery = _lazy("functions.codebase_discovery")
+        
+        results = codebase_discovery.analyze_codebase(project_path)
+        
+        if args.json:
+            json_default = _lazy("functions.analysis_controller").json_default
+            cls.emit_json(results, args.save, default=json_default)
+        else:
+            output = codebase_discovery.create_discovery_report(results)
+            cls.emit_text(output, args.save)
+        
+        return 0  # Discovery analysis doesn't have error conditions
 
 
 class TeamAnalysisCommand(BaseCommand):
     """Handles team collaboration analysis - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Git integration not available", "Team analysis failed")
+    def execute(cls, args) -> int:
         """Execute team analysis."""
-        try:
-            project_path = self.validate_path(args.team)
-            
-            from functions.git_integration import GitAnalyzer, TeamReportGenerator
-            
-            # Validate git repo
-            git_analyzer = GitAnalyzer(str(project_path))
-            if not git_analyzer.is_git_repo():
-                print("❌ Not a git repository")
-                return 1
-            
-            print(f"👥 Running team analysis on: {project_path}")
-            
-            # Generate team report
-            team_reporter = TeamReportGenerator(str(project_path))
-            basic_results = {"issues": []}  # Minimal for team report
-            team_report = team_reporter.generate_team_report(basic_results)
-            
-            if args.json:
-                output = json.dumps(team_report, indent=2, default=str)
-            else:
-                output = self._format_team_report(team_report)
-            
-            print(output)
-            
-            if args.save:
-                self.save_results(output, args.save)
-            
-            # Exit code based on commit readiness
-            status = team_report.get("commit_readiness", {}).get("status")
-            return {"blocked": 2, "caution": 1}.get(status, 0)
-            
-        except ImportError as e:
-            print(f"❌ Git integration not available: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Team analysis failed: {e}")
+        project_path = cls.validate_path(args.team)
+        
+        git_integration = _lazy("functions.git_integration")
+        
+        # Validate git repo
+        git_analyzer = git_integration.GitAnalyzer(project_path)
+        if not git_analyzer.is_git_repo():
+            print("❌ Not a git repository")
             return 1
+        
+        print(f"👥 Running team analysis on: {project_path}")
+        
+        # Generate team report
+        team_reporter = git_integration.TeamReportGenerator(project_path)
+        basic_results = {"issues": []}  # Minimal for team report
+        team_report = team_reporter.generate_team_report(basic_results)
+        
+        readiness = team_report.get("commit_readiness") or _EMPTY
+        
+        if args.json:
+            cls.emit_json(team_report, args.save, default=str)
+        else:
+            output = cls._format_team_report(team_report, readiness)
+            cls.emit_text(output, args.save)
+        
+        # Exit code based on commit readiness
+        return _TEAM_EXIT_CODES.get(readiness.get("status"), 0)
     
-    def _format_team_report(self, report: Dict[str, Any]) -> str:
+    @classmethod
+    def _format_team_report(cls, report: dict[str, object], readiness: dict[str, str]) -> str:
         """Format team report for display."""
-        lines = []
-        lines.append("👥 TEAM COLLABORATION REPORT")
-        lines.append("=" * 40)
-        
-        readiness = report.get("commit_readiness", {})
         status = readiness.get("status", "unknown")
         reason = readiness.get("reason", "No reason")
         action = readiness.get("action", "No action")
         
-        status_icons = {"ready": "✅", "caution": "⚠️", "blocked": "🚫"}
-        icon = status_icons.get(status, "❓")
+        icon = _STATUS_ICONS.get(status, "❓")
         
-        lines.append(f"{icon} COMMIT STATUS: {status.upper()}")
-        lines.append(f"Reason: {reason}")
-        lines.append(f"Action: {action}")
+        lines = [
+            "👥 TEAM COLLABORATION REPORT",
+            "=" * 40,
+            f"{icon} COMMIT STATUS: {status.upper()}",
+            f"Reason: {reason}",
+            f"Action: {action}",
+        ]
         
         # Add recommendations
         recommendations = report.get("team_recommendations", [])
         if recommendations:
-            lines.append("")
-            lines.append("📋 RECOMMENDATIONS:")
-            for rec in recommendations:
-                lines.append(f"  • {rec}")
+            lines.extend(("", "📋 RECOMMENDATIONS:"))
+            lines.extend(f"  • {rec}" for rec in recommendations)
         
         return "\n".join(lines)
 
@@ -400,61 +585,66 @@ class TeamAnalysisCommand(BaseCommand):
 class InstallHooksCommand(BaseCommand):
     """Handles git hook installation - FIXED IMPORTS."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Git integration not available", "Hook installation failed")
+    def execute(cls, args) -> int:
         """Execute hook installation."""
-        try:
-            project_path = self.validate_path(args.install_hooks)
-            
-            from functions.git_integration import GitAnalyzer
-            
-            git_analyzer = GitAnalyzer(str(project_path))
-            if not git_analyzer.is_git_repo():
-                print("❌ Not a git repository")
-                return 1
-            
-            print(f"🔧 Installing git hooks for: {project_path}")
-            
-            hook_config = {
-                "security_enabled": True,
-                "block_on_errors": True
-            }
-            
-            if git_analyzer.install_simple_pre_commit_hook(hook_config):
-                print("✅ Pre-commit hooks installed!")
-                return 0
-            else:
-                print("❌ Hook installation failed")
-                return 1
-                
-        except ImportError as e:
-            print(f"❌ Git integration not available: {e}")
+        project_path = cls.validate_path(args.install_hooks)
+        
+        git_analyzer = _lazy("functions.git_integration").GitAnalyzer(project_path)
+        if not git_analyzer.is_git_repo():
+            print("❌ Not a git repository")
             return 1
-        except Exception as e:
-            print(f"❌ Hook installation failed: {e}")
+        
+        print(f"🔧 Installing git hooks for: {project_path}")
+        
+        hook_config = {
+            "security_enabled": True,
+            "block_on_errors": True
+        }
+        
+        if git_analyzer.install_simple_pre_commit_hook(hook_config):
+            print("✅ Pre-commit hooks installed!")
+            return 0
+        else:
+            print("❌ Hook installation failed")
             return 1
 
 
 class PreCommitCommand(BaseCommand):
     """Handles pre-commit hook analysis - NEW COMMAND."""
     
-    def execute(self, args) -> int:
+    __slots__ = ()
+    
+    @classmethod
+    @_guarded("Pre-commit analysis not available", "Pre-commit analysis failed", icon="⚠️", exit_code=0)
+    def execute(cls, args) -> int:
         """Execute pre-commit analysis (called by git hooks)."""
-        try:
-            project_path = self.validate_path(args.pre_commit)
-            
-            from functions.git_integration import analyze_for_commit
-            
-            # Run pre-commit analysis with default config
-            config = {
-                "security_enabled": True,
-                "block_on_errors": False  # Don't block on regular errors in hooks
-            }
-            
-            return analyze_for_commit(str(project_path), config)
-                
-        except ImportError as e:
-            print(f"⚠️ Pre-commit analysis not available: {e}")
-            return 0  # Don't block commits on import errors
-        except Exception as e:
-            print(f"⚠️ Pre-commit analysis failed: {e}")
-            return 0  # Don't block commits on analysis failures
\ No newline at end of file
+        project_path = cls.validate_path(args.pre_commit)
+        
+        git_integration = _lazy("functions.git_integration")
+        
+        # Run pre-commit analysis with default config
+        config = {
+            "security_enabled": True,
+            "block_on_errors": False  # Don't block on regular errors in hooks
+        }
+        
+        return git_integration.analyze_for_commit(project_path, config)
+
+
+# Parsed attribute name -> command class, in mode precedence order
+_ROUTES = (
+    ("analyze", BasicAnalysisCommand),
+    ("security", SecurityAnalysisCommand),
+    ("comprehensive", ComprehensiveAnalysisCommand),
+    ("legacy", LegacyAnalysisCommand),
+    ("team", TeamAnalysisCommand),
+    ("install_hooks", InstallHooksCommand),
+    ("pre_commit", PreCommitCommand),
+)
+
+# Sniffed mode flag -> command class
+_COMMANDS = {"--" + name.replace("_", "-"): command_cls for name, command_cls in _ROUTES}
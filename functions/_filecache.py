@@ -0,0 +1,104 @@
+"""
+Per-File Result Cache
+=====================
+Shared on-disk memoization of per-file results for the analyzers
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'code_analyzer'
+
+# (absolute path, st_mtime_ns, st_size) identifying a file's current contents
+Stamp = Tuple[str, int, int]
+
+
+def file_stamp(file_str: str) -> Optional[Stamp]:
+    """Stat a file for its cache stamp, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(file_str)
+    except OSError:
+        return None
+    return os.path.abspath(file_str), st.st_mtime_ns, st.st_size
+
+
+class FileCache:
+    """
+    Pickled map of absolute path -> (st_mtime_ns, st_size, result).
+
+    A stored result is only returned while the file's mtime and size are
+    unchanged. The whole cache is discarded when its version or the
+    caller's fingerprint (the settings the results depend on) changes.
+    Loading and saving are best effort; any failure just means a cold cache.
+    """
+
+    def __init__(self, filename: str, version: int):
+        self.path = CACHE_DIR / filename
+        self.version = version
+        self._entries: Dict[str, Tuple[int, int, Any]] = {}
+        self._loaded_for: Optional[str] = None
+        self._dirty = False
+
+    def load(self, fingerprint: str = '') -> None:
+        """Load the on-disk cache once per fingerprint; mismatched or unreadable caches start empty."""
+        if self._loaded_for == fingerprint:
+            return
+
+        self._entries.clear()
+        self._loaded_for = fingerprint
+        self._dirty = False
+        try:
+            with open(self.path, 'rb') as f:
+                version, cached_for, entries = pickle.load(f)
+            if version == self.version and cached_for == fingerprint:
+                self._entries.update(entries)
+        except Exception:
+            pass  # Missing or corrupt cache - rebuild it
+
+    def get(self, stamp: Optional[Stamp]) -> Any:
+        """The result stored for an unchanged file, else None."""
+        if stamp is None:
+            return None
+        cached = self._entries.get(stamp[0])
+        if cached is None or cached[0] != stamp[1] or cached[1] != stamp[2]:
+            return None
+        return cached[2]
+
+    def put(self, stamp: Optional[Stamp], result: Any) -> None:
+        """Store a file's result under the stamp taken before it was read."""
+        if stamp is None:
+            return
+        self._entries[stamp[0]] = (stamp[1], stamp[2], result)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back atomically if anything changed; failures are ignored."""
+        if not self._dirty:
+            return
+
+        # Snapshot first: dict() copies in one step, so puts from other
+        # threads can't change the entries while they are being pickled
+        self._dirty = False
+        entries = dict(self._entries)
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per save, so concurrent saves never share one
+            with tempfile.NamedTemporaryFile('wb', dir=self.path.parent, prefix=f"{self.path.name}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                pickle.dump((self.version, self._loaded_for, entries), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except (OSError, pickle.PickleError, RecursionError):
+            # Read-only home, unpicklable or too deeply nested results etc. -
+            # caching is best effort
+            self._dirty = True
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
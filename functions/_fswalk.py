@@ -0,0 +1,51 @@
+"""
+File System Walk
+================
+Shared *.py discovery for the analyzers and the controller
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+def iter_py_files(root: str, exclude: Iterable[str] = (), exclude_dirs: Iterable[str] = ()) -> Iterator[str]:
+    """
+    Yield *.py entry paths in Path.rglob order with one os.scandir walk.
+
+    DirEntry reuses the file type from the directory listing, so no
+    per-file stat() is needed. Subdirectories are pruned before recursing
+    when their lower-cased path contains one of the exclude substrings, or
+    their name is in exclude_dirs - every file below them would be filtered
+    out by those same checks anyway. Callers still filter the yielded
+    files themselves; pruning only skips work.
+    """
+    exclude = tuple(exclude)
+    exclude_dirs = frozenset(exclude_dirs)
+    yield from _walk(root, exclude, exclude_dirs)
+
+
+def _walk(directory: str, exclude: tuple, exclude_dirs: frozenset) -> Iterator[str]:
+    """Yield a directory's matches, then recurse into its kept subdirectories."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py"):
+                    yield entry.path
+                try:
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        return
+    for entry in subdirs:
+        if entry.name in exclude_dirs:
+            continue
+        if exclude:
+            # Match against the normalized spelling the callers filter on
+            dir_str = str(Path(entry.path)).lower()
+            if any(pattern in dir_str for pattern in exclude):
+                continue
+        yield from _walk(entry.path, exclude, exclude_dirs)
@@ -0,0 +1,50 @@
+"""
+Process Pool Map
+================
+Shared ordered per-file fan-out for the analyzers
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Analyzers run on controller and GUI worker threads, and fork() from a
+# multi-threaded process can deadlock the child; start workers from a
+# clean single-threaded server (or fresh interpreters) instead
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    """The multiprocessing context every worker pool should be created with."""
+    return multiprocessing.get_context(_START_METHOD)
+
+
+def map_in_processes(func: Callable[[T], R], items: Sequence[T], min_items: int, chunksize: int,
+                     fallback: Optional[Callable[[Sequence[T]], List[R]]] = None) -> List[R]:
+    """
+    Return [func(item) for item in items], across worker processes once there are enough items.
+
+    func must be a module-level function so workers can pickle it; workers
+    never fork from the calling process, so this is safe from threads. Below
+    min_items, on a single CPU, inside a worker process (pools don't nest),
+    or when no worker processes can be started, the items are handled
+    in-process by fallback, which defaults to a plain loop.
+    """
+    if fallback is None:
+        def fallback(pending: Sequence[T]) -> List[R]:
+            return [func(item) for item in pending]
+
+    if (len(items) < min_items or (os.cpu_count() or 1) < 2
+            or multiprocessing.parent_process() is not None):
+        return fallback(items)
+
+    try:
+        with ProcessPoolExecutor(mp_context=pool_context()) as executor:
+            return list(executor.map(func, items, chunksize=chunksize))
+    except (OSError, BrokenProcessPool):
+        return fallback(items)
@@ -4,12 +4,53 @@ Analysis Controller - Core Orchestration Only
 Focused on analysis coordination, delegates formatting to specialized modules
 """
 
+import functools
+import importlib.util
+import os
+import stat
 import threading
+import time
 import json
-from dataclasses import dataclass, asdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Union
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union, Mapping
+
+from functions._fswalk import iter_py_files
+from functions._procpool import pool_context
+
+try:
+    import orjson  # Optional: much faster JSON export
+except ImportError:
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """json default hook: expand dataclasses one level, stringify anything else."""
+    fields = getattr(obj, "__dataclass_fields__", None)
+    if fields is not None and not isinstance(obj, type):
+        # Shallow on purpose - the encoder walks nested values itself
+        return {name: getattr(obj, name) for name in fields}
+    return str(obj)
+
+
+# Typical bytes per line of Python source, for size-based line estimates
+_AVG_LINE_BYTES = 32
+
+# How long a project's *.py listing is reused. Long enough for one
+# validate -> stats sequence; short enough that files added in
+# subdirectories (which don't touch the root's mtime) show up next time.
+_SCAN_REUSE_SECONDS = 2.0
+
+# How often a waiting analysis wakes up to check for cancellation
+_CANCEL_POLL_SECONDS = 0.2
+
+
+class AnalysisCancelled(Exception):
+    """Raised inside an analysis run when cancel_analysis() was called."""
 
 
 @dataclass
@@ -22,12 +63,103 @@ class AnalysisResults:
     modules_used: List[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The dict is shallow - it shares results and issues with this object
+        rather than deep-copying them; nested dataclasses (issues) are left
+        for the encoder, e.g. json.dumps(..., default=json_default).
+        """
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        if orjson is not None and indent in (None, 2):
+            return self.to_json_bytes(indent).decode("utf-8")
+        return json.dumps(self.to_dict(), indent=indent, default=json_default)
+    
+    def to_json_bytes(self, indent: Optional[int] = 2) -> bytes:
+        """Convert to UTF-8 JSON bytes, ready to write to a binary file.
+        
+        With orjson installed the dataclass is serialized natively; orjson
+        only supports 2-space indentation.
+        """
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(self, default=str, option=option)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits - let the stdlib handle it
+        return json.dumps(self.to_dict(), indent=indent, default=json_default).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _module_available(import_path: str) -> bool:
+    """Check that a module can be found without executing it (cached)."""
+    try:
+        return importlib.util.find_spec(import_path) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """stat() path, or None where Path.exists() would report False."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count lines the way readlines() would, on raw bytes in 64 KiB chunks."""
+    lines = 0
+    last = b"\n"
+    with open(file_path, 'rb', buffering=0) as f:
+        while True:
+            chunk = f.read(1 << 16)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return lines if last == b"\n" else lines + 1
+
+
+def _start_daemon(func: Callable[..., Any], *args: Any,
+                  slots: Optional[threading.Semaphore] = None) -> Future:
+    """
+    Run func(*args) on a new daemon thread; return a Future for its result.
+    
+    Unlike executor workers, daemon threads are not joined at interpreter
+    exit, so abandoning a cancelled run never holds the process open. With
+    slots, the call waits for a free slot first and is skipped if the
+    future was cancelled in the meantime.
+    """
+    future: Future = Future()
+    
+    def run():
+        if slots is not None:
+            slots.acquire()
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        finally:
+            if slots is not None:
+                slots.release()
+    
+    threading.Thread(target=run, name="analysis", daemon=True).start()
+    return future
+
+
+def _run_module_in_process(module_name: str, project_path: str) -> Tuple[Dict[str, Any], List[Any]]:
+    """Process-pool entry point: run one module, return (its results keys, issues)."""
+    return AnalysisController()._run_module_isolated(module_name, project_path)
 
 
 class AnalysisController:
@@ -41,33 +173,113 @@ class AnalysisController:
     - Result aggregation
     """
     
+    # Module id -> (import path, entry point) used by the _run_* methods
+    _ENTRY_POINTS = {
+        "code_analyzer": ("functions.code_analyzer", "analyze_project"),
+        "security_scanner": ("functions.security_scanner", "SecurityScanner"),
+        "dependency_analyzer": ("functions.dependency_analyzer", "analyze_project"),
+        "codebase_discovery": ("functions.codebase_discovery", "analyze_codebase"),
+        "git_integration": ("functions.git_integration", "GitAnalyzer"),
+    }
+    # Entry points resolved so far, shared by all controllers
+    _MODULE_FUNCS: Dict[str, Callable] = {}
+    
+    # Static module descriptions; get_module_info() adds "available"
+    _MODULE_INFO_TEMPLATE = {
+        "code_analyzer": {
+            "name": "Code Quality Analyzer",
+            "description": "Analyzes code structure, complexity, and quality issues",
+            "produces_issues": True
+        },
+        "security_scanner": {
+            "name": "Security Scanner",
+            "description": "Scans for security vulnerabilities and potential threats",
+            "produces_issues": True
+        },
+        "dependency_analyzer": {
+            "name": "Dependency Analyzer",
+            "description": "Analyzes project dependencies and import structure",
+            "produces_issues": True
+        },
+        "codebase_discovery": {
+            "name": "Codebase Discovery",
+            "description": "Discovers project structure, frameworks, and entry points",
+            "produces_issues": False
+        },
+        "git_integration": {
+            "name": "Git Integration",
+            "description": "Analyzes git repository information and status",
+            "produces_issues": False
+        },
+    }
+    
     def __init__(self, main_window=None):
         self.available_modules = self._discover_modules()
-        self._current_thread: Optional[threading.Thread] = None
-        self._is_running = False
+        self._available_view = MappingProxyType(self.available_modules)
+        self._module_info = self._build_module_info()
+        # One background analysis at a time, tracked by its Future. Runs use
+        # daemon threads so a window closed mid-analysis doesn't block exit.
+        self._current_future: Optional[Future] = None
+        self._shut_down = False
+        self._cancel_event = threading.Event()
         self.main_window = main_window  # Store reference for thread-safe GUI calls
+        # project path -> (root mtime_ns, scan time, *.py paths) shared by validation and stats
+        self._path_cache: Dict[str, Tuple[int, float, List[Path]]] = {}
+        # Module id -> runner; each returns the issues it found
+        self._runners: Dict[str, Callable[[Dict[str, Any], str], List[Any]]] = {
+            "code_analyzer": self._run_code_analysis,
+            "security_scanner": self._run_security_analysis,
+            "dependency_analyzer": self._run_dependency_analysis,
+            "codebase_discovery": self._run_codebase_discovery,
+            "git_integration": self._run_git_analysis,
+        }
         
-    def get_available_modules(self) -> Dict[str, bool]:
-        """Return which analysis modules are available."""
-        return self.available_modules.copy()
+    def get_available_modules(self) -> Mapping[str, bool]:
+        """Return which analysis modules are available (a read-only view)."""
+        return self._available_view
     
-    def refresh_module_availability(self) -> Dict[str, bool]:
+    def refresh_module_availability(self) -> Mapping[str, bool]:
         """Refresh and return updated module availability."""
+        _module_available.cache_clear()
+        importlib.invalidate_caches()
         self.available_modules = self._discover_modules()
+        self._available_view = MappingProxyType(self.available_modules)
+        self._module_info = self._build_module_info()
         return self.get_available_modules()
     
     def is_analysis_running(self) -> bool:
         """Check if analysis is currently running."""
-        return self._is_running
+        return self._current_future is not None and not self._current_future.done()
     
     def cancel_analysis(self) -> bool:
-        """Cancel running analysis if possible."""
-        if self._current_thread and self._current_thread.is_alive():
-            # Note: Python threading doesn't support true cancellation
-            # This is a placeholder for potential future implementation
-            return False
+        """
+        Cancel running analysis.
+        
+        The run stops at its next checkpoint (between modules, or within
+        _CANCEL_POLL_SECONDS while waiting on concurrent modules) and
+        completes with a failed "Analysis cancelled" result. Modules that
+        are already executing finish in the background; their output is
+        discarded.
+        """
+        self._cancel_event.set()
         return True
     
+    def shutdown(self) -> None:
+        """
+        Cancel any running analysis and stop delivering its callbacks.
+        
+        A module that is mid-way through keeps running on its daemon thread
+        until it finishes or the interpreter exits; nothing it produces is
+        scheduled on the (possibly destroyed) main window any more.
+        """
+        self._shut_down = True
+        self.cancel_analysis()
+    
+    def _check_cancelled(self) -> None:
+        """Raise AnalysisCancelled if cancellation was requested."""
+        if self._cancel_event.is_set():
+            raise AnalysisCancelled("Analysis cancelled")
+    
     def run_analysis_async(self, 
                           project_path: str,
                           enabled_modules: Dict[str, bool],
@@ -78,13 +290,16 @@ class AnalysisController:
         
         This is the MAIN way GUI should trigger analysis.
         """
-        if self._current_thread and self._current_thread.is_alive():
+        if self.is_analysis_running():
             progress_callback("❌ Analysis already running")
             return
             
+        # Cleared before the worker starts, so a cancel issued straight
+        # after this call still applies to this run
+        self._cancel_event.clear()
+        
         def worker():
-            """Background worker thread that executes the analysis process."""
-            self._is_running = True
+            """Background worker that executes the analysis process."""
             try:
                 progress_callback("🔍 Starting analysis...")
                 results = self._run_analysis_sync(project_path, enabled_modules, progress_callback)
@@ -99,38 +314,75 @@ class AnalysisController:
                 )
                 # Schedule callback on main thread
                 self._schedule_on_main_thread(lambda: completion_callback(error_result))
-            finally:
-                self._is_running = False
         
-        self._current_thread = threading.Thread(target=worker, daemon=True)
-        self._current_thread.start()
+        self._current_future = _start_daemon(worker)
     
     def _schedule_on_main_thread(self, callback):
-        """Schedule a callback to run on the main GUI thread."""
+        """Schedule a callback to run on the main GUI thread (dropped after shutdown())."""
+        if self._shut_down:
+            return
         if self.main_window:
             # Use tkinter's after() method to schedule on main thread
-            self.main_window.after(0, callback)
+            try:
+                self.main_window.after(0, callback)
+            except Exception:
+                pass  # Window destroyed between the check and the call
         else:
             # Fallback - call directly (for CLI usage)
             callback()
     
     def run_analysis_sync(self, 
                          project_path: str,
-                         enabled_modules: Dict[str, bool]) -> AnalysisResults:
+                         enabled_modules: Dict[str, bool],
+                         max_workers: Optional[int] = None,
+                         progress_callback: Optional[Callable[[str], None]] = None) -> AnalysisResults:
         """
         Run analysis synchronously - mainly for CLI usage.
         GUI should use run_analysis_async instead.
+        
+        The enabled modules run concurrently in threads (one per module, up
+        to 5, unless max_workers says otherwise; 1 runs them in sequence).
+        Progress is printed to stdout unless a progress_callback is given.
         """
         def dummy_progress(msg: str):
             """Simple progress callback that prints messages to stdout."""
             print(f"Progress: {msg}")
         
-        return self._run_analysis_sync(project_path, enabled_modules, dummy_progress)
+        # A cancel aimed at an earlier run must not stop this one
+        self._cancel_event.clear()
+        return self._run_analysis_sync(
+            project_path, enabled_modules, progress_callback or dummy_progress, max_workers
+        )
+    
+    def run_analysis_parallel(self,
+                              project_path: str,
+                              enabled_modules: Dict[str, bool],
+                              max_workers: Optional[int] = None,
+                              progress_callback: Optional[Callable[[str], None]] = None) -> AnalysisResults:
+        """
+        Run analysis with the enabled modules in separate worker processes.
+        
+        The analyzers are CPU-bound AST/regex work, so processes sidestep
+        the GIL that limits the threaded path. max_workers defaults to the
+        CPU count; results are merged in enabled-module order.
+        """
+        def dummy_progress(msg: str):
+            """Simple progress callback that prints messages to stdout."""
+            print(f"Progress: {msg}")
+        
+        # A cancel aimed at an earlier run must not stop this one
+        self._cancel_event.clear()
+        return self._run_analysis_sync(
+            project_path, enabled_modules, progress_callback or dummy_progress,
+            max_workers or os.cpu_count() or 1, use_processes=True
+        )
     
     def _run_analysis_sync(self, 
                           project_path: str, 
                           enabled_modules: Dict[str, bool],
-                          progress_callback: Callable[[str], None]) -> AnalysisResults:
+                          progress_callback: Callable[[str], None],
+                          max_workers: Optional[int] = None,
+                          use_processes: bool = False) -> AnalysisResults:
         """Internal sync analysis - core orchestration logic."""
         
         # Validate project path
@@ -161,15 +413,26 @@ class AnalysisController:
         
         # Run each module with proper error handling
         total_modules = len(enabled_list)
-        for i, module_name in enumerate(enabled_list, 1):
-            try:
-                progress_callback(f"📊 ({i}/{total_modules}) Running {module_name}...")
-                module_issues = self._run_single_module(module_name, results, project_path)
-                all_issues.extend(module_issues)
-            except Exception as e:
-                # Log error but continue with other modules
-                print(f"Warning: {module_name} failed: {e}")
-                results[f"{module_name}_error"] = str(e)
+        if max_workers is None:
+            max_workers = min(total_modules, 5)
+        if max_workers > 1 and total_modules > 1:
+            all_issues = self._run_modules_concurrently(
+                enabled_list, results, project_path, progress_callback, max_workers,
+                use_processes
+            )
+        else:
+            for i, module_name in enumerate(enabled_list, 1):
+                self._check_cancelled()
+                try:
+                    progress_callback(f"📊 ({i}/{total_modules}) Running {module_name}...")
+                    module_issues = self._run_module_cancellable(module_name, results, project_path)
+                    all_issues.extend(module_issues)
+                except AnalysisCancelled:
+                    raise
+                except Exception as e:
+                    # Log error but continue with other modules
+                    print(f"Warning: {module_name} failed: {e}")
+                    results[f"{module_name}_error"] = str(e)
         
         progress_callback(f"✅ Complete - {len(all_issues)} issues found")
         
@@ -180,29 +443,122 @@ class AnalysisController:
             modules_used=enabled_list
         )
     
+    def _run_modules_concurrently(self,
+                                  enabled_list: List[str],
+                                  results: Dict[str, Any],
+                                  project_path: str,
+                                  progress_callback: Callable[[str], None],
+                                  max_workers: int,
+                                  use_processes: bool = False) -> List[Any]:
+        """Run modules in a thread or process pool.
+        
+        Each module fills its own results dict, so workers never share
+        state; the pieces are merged afterwards in enabled_list order, which
+        keeps both the results keys and the issues deterministic.
+        """
+        total_modules = len(enabled_list)
+        module_issues: Dict[str, List[Any]] = {}
+        module_results: Dict[str, Dict[str, Any]] = {}
+        workers = min(max_workers, total_modules)
+        if use_processes:
+            # Never fork: this runs on GUI/controller threads
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+            
+            def submit(module_name: str) -> Future:
+                return executor.submit(_run_module_in_process, module_name, project_path)
+        else:
+            # Daemon threads rather than a ThreadPoolExecutor, whose workers
+            # are joined at exit even after a cancelled run abandons them
+            executor = None
+            slots = threading.Semaphore(workers)
+            
+            def submit(module_name: str) -> Future:
+                return _start_daemon(self._run_module_isolated, module_name, project_path,
+                                     slots=slots)
+        
+        progress_callback(f"📊 Running {total_modules} modules concurrently...")
+        futures = {submit(module_name): module_name for module_name in enabled_list}
+        pending = set(futures)
+        finished = 0
+        try:
+            while pending:
+                # Wake up periodically so a cancel request is noticed promptly
+                done, pending = wait(pending, timeout=_CANCEL_POLL_SECONDS,
+                                     return_when=FIRST_COMPLETED)
+                self._check_cancelled()
+                for future in sorted(done, key=lambda f: enabled_list.index(futures[f])):
+                    module_name = futures[future]
+                    finished += 1
+                    try:
+                        module_results[module_name], module_issues[module_name] = future.result()
+                        progress_callback(f"📊 ({finished}/{total_modules}) Finished {module_name}")
+                    except Exception as e:
+                        # Log error but continue with other modules
+                        print(f"Warning: {module_name} failed: {e}")
+                        module_results[module_name] = {f"{module_name}_error": str(e)}
+        except AnalysisCancelled:
+            # Drop queued modules and don't wait for the running ones
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+            raise
+        if executor is not None:
+            executor.shutdown()
+        
+        all_issues = []
+        for module_name in enabled_list:
+            results.update(module_results.get(module_name, {}))
+            all_issues.extend(module_issues.get(module_name, []))
+        return all_issues
+    
+    def _run_module_cancellable(self, module_name: str, results: Dict[str, Any],
+                                project_path: str) -> List[Any]:
+        """
+        Run a single module on a helper thread, checking for cancellation while it works.
+        
+        The analyzers themselves have no cancellation checkpoints, so a
+        cancelled module finishes in the background and its output is
+        discarded, as with concurrent runs.
+        """
+        future = _start_daemon(self._run_module_isolated, module_name, project_path)
+        while True:
+            try:
+                module_results, issues = future.result(timeout=_CANCEL_POLL_SECONDS)
+                break
+            except FuturesTimeoutError:
+                self._check_cancelled()
+        results.update(module_results)
+        return issues
+    
+    def _run_module_isolated(self, module_name: str,
+                             project_path: str) -> Tuple[Dict[str, Any], List[Any]]:
+        """Run a single module into a fresh results dict; return (results, issues)."""
+        module_results: Dict[str, Any] = {}
+        issues = self._run_single_module(module_name, module_results, project_path)
+        return module_results, issues
+    
     def _run_single_module(self, module_name: str, results: Dict[str, Any], 
                           project_path: str) -> List[Any]:
         """Run a single analysis module."""
-        if module_name == "code_analyzer":
-            return self._run_code_analysis(results, project_path)
-        elif module_name == "security_scanner":
-            return self._run_security_analysis(results, project_path)
-        elif module_name == "dependency_analyzer":
-            return self._run_dependency_analysis(results, project_path)
-        elif module_name == "codebase_discovery":
-            self._run_codebase_discovery(results, project_path)
-            return []  # Discovery doesn't typically produce "issues"
-        elif module_name == "git_integration":
-            self._run_git_analysis(results, project_path)
-            return []  # Git analysis doesn't produce "issues"
-        else:
+        runner = self._runners.get(module_name)
+        if runner is None:
             raise ValueError(f"Unknown module: {module_name}")
+        return runner(results, project_path)
+    
+    @classmethod
+    def _get(cls, module_name: str) -> Callable:
+        """Import a module's entry point on first use and memoize it."""
+        func = cls._MODULE_FUNCS.get(module_name)
+        if func is None:
+            import_path, attr = cls._ENTRY_POINTS[module_name]
+            func = cls._MODULE_FUNCS[module_name] = getattr(importlib.import_module(import_path), attr)
+        return func
     
     def _run_code_analysis(self, results: Dict[str, Any], project_path: str) -> List[Any]:
         """Run code quality analysis."""
         try:
-            from functions.code_analyzer import analyze_project
-            analysis_results = analyze_project(project_path)
+            analysis_results = self._get("code_analyzer")(project_path)
             results.update(analysis_results)
             return analysis_results.get("issues", [])
         except Exception as e:
@@ -213,8 +569,7 @@ class AnalysisController:
     def _run_security_analysis(self, results: Dict[str, Any], project_path: str) -> List[Any]:
         """Run security vulnerability scanning."""
         try:
-            from functions.security_scanner import SecurityScanner
-            security_results = SecurityScanner().scan_project(project_path)
+            security_results = self._get("security_scanner")().scan_project(project_path)
             results["security_scan"] = security_results
             return security_results.get("security_issues", [])
         except Exception as e:
@@ -225,8 +580,7 @@ class AnalysisController:
     def _run_dependency_analysis(self, results: Dict[str, Any], project_path: str) -> List[Any]:
         """Run dependency analysis using simplified API."""
         try:
-            from functions.dependency_analyzer import analyze_project
-            dependency_results = analyze_project(project_path)
+            dependency_results = self._get("dependency_analyzer")(project_path)
             results["dependencies"] = dependency_results
             return dependency_results.get("issues", [])
         except Exception as e:
@@ -234,11 +588,10 @@ class AnalysisController:
             results["dependency_analysis_error"] = str(e)
             return []
     
-    def _run_codebase_discovery(self, results: Dict[str, Any], project_path: str) -> None:
+    def _run_codebase_discovery(self, results: Dict[str, Any], project_path: str) -> List[Any]:
         """Run codebase discovery using simplified API."""
         try:
-            from functions.codebase_discovery import analyze_codebase
-            discovery_result = analyze_codebase(project_path)
+            discovery_result = self._get("codebase_discovery")(project_path)
             
             results["legacy_analysis"] = {
                 "entry_points": discovery_result.entry_points,
@@ -252,12 +605,12 @@ class AnalysisController:
         except Exception as e:
             print(f"Codebase discovery failed: {e}")
             results["codebase_discovery_error"] = str(e)
+        return []  # Discovery doesn't typically produce "issues"
     
-    def _run_git_analysis(self, results: Dict[str, Any], project_path: str) -> None:
+    def _run_git_analysis(self, results: Dict[str, Any], project_path: str) -> List[Any]:
         """Run git repository analysis."""
         try:
-            from functions.git_integration import GitAnalyzer
-            git_analyzer = GitAnalyzer(project_path)
+            git_analyzer = self._get("git_integration")(project_path)
             
             if git_analyzer.is_git_repo():
                 results["git_info"] = {
@@ -271,98 +624,84 @@ class AnalysisController:
         except Exception as e:
             print(f"Git analysis failed: {e}")
             results["git_info"] = {"is_repo": False, "error": str(e)}
+        return []  # Git analysis doesn't produce "issues"
     
     def _discover_modules(self) -> Dict[str, bool]:
         """Discover which analysis modules are available."""
-        modules = {
-            "code_analyzer": "functions.code_analyzer",
-            "security_scanner": "functions.security_scanner", 
-            "dependency_analyzer": "functions.dependency_analyzer",
-            "codebase_discovery": "functions.codebase_discovery",
-            "git_integration": "functions.git_integration",
+        return {
+            module_id: _module_available(import_path)
+            for module_id, (import_path, _) in self._ENTRY_POINTS.items()
         }
-        
-        available = {}
-        for module_id, import_path in modules.items():
-            try:
-                __import__(import_path)
-                available[module_id] = True
-            except Exception:
-                available[module_id] = False
-        
-        return available
     
     # === UTILITY METHODS FOR ADVANCED USAGE ===
     
     def get_module_info(self) -> Dict[str, Dict[str, Any]]:
-        """Get detailed information about each module."""
+        """
+        Get detailed information about each module.
+        
+        Built once per availability change; treat the result as read-only.
+        """
+        return self._module_info
+    
+    def _build_module_info(self) -> Dict[str, Dict[str, Any]]:
+        """Combine the static module descriptions with current availability."""
         return {
-            "code_analyzer": {
-                "name": "Code Quality Analyzer",
-                "description": "Analyzes code structure, complexity, and quality issues",
-                "available": self.available_modules.get("code_analyzer", False),
-                "produces_issues": True
-            },
-            "security_scanner": {
-                "name": "Security Scanner",
-                "description": "Scans for security vulnerabilities and potential threats",
-                "available": self.available_modules.get("security_scanner", False),
-                "produces_issues": True
-            },
-            "dependency_analyzer": {
-                "name": "Dependency Analyzer", 
-                "description": "Analyzes project dependencies and import structure",
-                "available": self.available_modules.get("dependency_analyzer", False),
-                "produces_issues": True
-            },
-            "codebase_discovery": {
-                "name": "Codebase Discovery",
-                "description": "Discovers project structure, frameworks, and entry points",
-                "available": self.available_modules.get("codebase_discovery", False),
-                "produces_issues": False
-            },
-            "git_integration": {
-                "name": "Git Integration",
-                "description": "Analyzes git repository information and status",
-                "available": self.available_modules.get("git_integration", False),
-                "produces_issues": False
+            module_id: {
+                "name": info["name"],
+                "description": info["description"],
+                "available": self.available_modules.get(module_id, False),
+                "produces_issues": info["produces_issues"]
             }
+            for module_id, info in self._MODULE_INFO_TEMPLATE.items()
         }
     
     def validate_project_path(self, project_path: Union[str, Path]) -> tuple[bool, str]:
         """Validate a project path for analysis."""
         path = Path(project_path)
         
-        if not path.exists():
+        # One stat() answers both "exists" and "is a directory"
+        root_stat = _stat_or_none(path)
+        if root_stat is None:
             return False, f"Path does not exist: {path}"
         
-        if not path.is_dir():
+        if not stat.S_ISDIR(root_stat.st_mode):
             return False, f"Path is not a directory: {path}"
         
         # Check for Python files
-        python_files = list(path.rglob("*.py"))
+        python_files = self._scan_project(path, root_stat)
         if not python_files:
             return False, f"No Python files found in: {path}"
         
         return True, f"Valid project with {len(python_files)} Python files"
     
-    def get_project_stats(self, project_path: Union[str, Path]) -> Dict[str, Any]:
-        """Get basic statistics about a project without running full analysis."""
+    def get_project_stats(self, project_path: Union[str, Path], precise: bool = False) -> Dict[str, Any]:
+        """
+        Get basic statistics about a project without running full analysis.
+        
+        estimated_lines covers every *.py file and is derived from file
+        sizes (one stat() per file); pass precise=True to count the lines
+        by reading the files instead.
+        """
         path = Path(project_path)
         
-        if not path.exists():
+        root_stat = _stat_or_none(path)
+        if root_stat is None:
             return {"error": "Path does not exist"}
         
         try:
-            python_files = list(path.rglob("*.py"))
+            python_files = self._scan_project(path, root_stat)
             total_lines = 0
             
-            for file_path in python_files[:100]:  # Limit to first 100 files for speed
+            for file_path in python_files:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        total_lines += len(f.readlines())
+                    if precise:
+                        total_lines += _count_lines(file_path)
+                    else:
+                        total_lines += os.stat(file_path).st_size
                 except Exception:
                     continue
+            if not precise:
+                total_lines //= _AVG_LINE_BYTES
             
             return {
                 "total_python_files": len(python_files),
@@ -373,6 +712,28 @@ class AnalysisController:
         except Exception as e:
             return {"error": str(e)}
     
+    def _scan_project(self, path: Path, root_stat: Optional[os.stat_result] = None) -> List[Path]:
+        """
+        List the project's *.py paths in rglob order with a single scandir walk.
+        
+        DirEntry reuses the file type from the directory listing, so no
+        per-file stat() is needed. The list is reused for _SCAN_REUSE_SECONDS
+        while the root directory's mtime is unchanged, so validate-then-stats
+        shares one walk; after that the tree is walked again, since changes
+        below the root don't show in its mtime. Callers that already
+        stat()ed the root pass it in as root_stat.
+        """
+        key = str(path)
+        mtime = (root_stat or os.stat(key)).st_mtime_ns
+        now = time.monotonic()
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] == mtime and now - cached[1] < _SCAN_REUSE_SECONDS:
+            return cached[2]
+        
+        python_files = [Path(entry_path) for entry_path in iter_py_files(key)]
+        self._path_cache[key] = (mtime, now, python_files)
+        return python_files
+    
     def save_results(self, results: AnalysisResults, output_path: Union[str, Path]) -> bool:
         """Save analysis results to a file."""
         try:
@@ -380,14 +741,12 @@ class AnalysisController:
             
             if output_path.suffix.lower() == '.json':
                 # Save as JSON
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(results.to_json())
+                with open(output_path, 'wb') as f:
+                    f.write(results.to_json_bytes())
             else:
                 # Save as text - delegate to formatter
-                from functions.results_formatter import format_results_for_display
-                formatted_text = format_results_for_display(results)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_text)
+                from functions.results_formatter import save_results_to_file
+                save_results_to_file(results, output_path)
             
             return True
         except Exception as e:
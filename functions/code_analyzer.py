@@ -4,12 +4,29 @@ Code Analyzer
 """
 
 import ast
+import functools
+import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 from dataclasses import dataclass
 
+try:
+    from functions._filecache import FileCache, Stamp, file_stamp
+    from functions._fswalk import iter_py_files
+    from functions._procpool import map_in_processes
+except ImportError:  # Run directly as a script from inside functions/
+    from _filecache import FileCache, Stamp, file_stamp
+    from _fswalk import iter_py_files
+    from _procpool import map_in_processes
 
-@dataclass
+
+# slots drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Issue:
     """Simple issue container with CONSISTENT field names."""
     file_path: str  # Changed from 'file' to 'file_path' for consistency
@@ -26,10 +43,25 @@ CONFIG = {
     'max_class_methods': 20,
     'ignore_private': True,
     'ignore_test_files': True,
-    'exclude_patterns': {'__pycache__', '.git', '*.pyc', 'venv', 'env'}
+    'exclude_patterns': {'__pycache__', '.git', '*.pyc', 'venv', 'env', 'node_modules', '.tox'},
+    'cache_results': True
 }
 
 
+# Persistent per-file results: abs path -> (mtime, size, (issue rows, lines, functions, classes))
+# Bump the version when the checks change so stale cached issues are discarded
+_CACHE_VERSION = 2
+_FILE_CACHE = FileCache('file_cache.pickle', _CACHE_VERSION)
+
+
+def _config_key() -> str:
+    """Stable fingerprint of the settings that affect per-file results."""
+    return repr(sorted(
+        (key, sorted(value) if isinstance(value, set) else value)
+        for key, value in CONFIG.items()
+    ))
+
+
 class CodeAnalyzer:
     """Just finds problems."""
     
@@ -43,20 +75,48 @@ class CodeAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"Path not found: {project_path}")
         
-        # Find and analyze Python files
-        python_files = [f for f in path.rglob("*.py") if self._should_analyze(f)]
+        path_str = str(path)
         
-        for file_path in python_files:
-            try:
-                self._analyze_file(file_path)
-            except Exception as e:
-                self.issues.append(Issue(
-                    file_path=str(file_path),  # FIXED: Use full file path
-                    line_number=0, 
-                    issue_type="parse_error",
-                    message=f"Failed to parse: {e}", 
-                    severity="error"
-                ))
+        # Find and analyze Python files, as normalized path strings
+        skip = self._skip_substrings()
+        python_files = [
+            file_str for file_str in (str(Path(p)) for p in iter_py_files(path_str, skip))
+            if not _contains_any(file_str.lower(), skip)
+        ]
+        
+        # Workers re-import this module with the default CONFIG, so they
+        # get this run's settings explicitly
+        config = dict(CONFIG)
+        use_cache = config.get('cache_results', False)
+        if use_cache:
+            _FILE_CACHE.load(_config_key())
+        
+        # Replay unchanged files from the cache, analyze the rest
+        outcomes = [None] * len(python_files)
+        stamps = {}
+        pending = []
+        for index, file_str in enumerate(python_files):
+            if use_cache:
+                stamp = file_stamp(file_str)
+                outcomes[index] = _cached_outcome(file_str, stamp)
+                stamps[index] = stamp
+            if outcomes[index] is None:
+                pending.append(index)
+        
+        fresh = _analyze_many([python_files[index] for index in pending], config)
+        for index, outcome in zip(pending, fresh):
+            outcomes[index] = outcome
+            if use_cache:
+                _store_outcome(stamps[index], outcome)
+        
+        if use_cache:
+            _FILE_CACHE.save()
+        
+        # Merge in file order
+        for issues, stats, _ in outcomes:
+            self.issues.extend(issues)
+            for key, value in stats.items():
+                self.stats[key] += value
         
         return {
             'issues': self.issues,
@@ -64,37 +124,40 @@ class CodeAnalyzer:
             'total_functions': self.stats['functions'], 
             'total_classes': self.stats['classes'],
             'total_lines': self.stats['lines'],
-            'project_path': str(path),
+            'project_path': path_str,
             'files_analyzed': len(python_files)
         }
     
-    def _should_analyze(self, file_path: Path) -> bool:
-        """Quick file filtering."""
-        file_str = str(file_path).lower()
-        
+    def _skip_substrings(self) -> Tuple[str, ...]:
+        """Lower-case path substrings that exclude a file, from the current CONFIG."""
         # Skip excluded patterns
-        for pattern in CONFIG['exclude_patterns']:
-            if pattern.replace('*', '') in file_str:
-                return False
+        skip = [pattern.replace('*', '') for pattern in CONFIG['exclude_patterns']]
         
         # Skip test files if configured
-        if CONFIG['ignore_test_files'] and 'test' in file_str:
-            return False
-            
-        return True
+        if CONFIG['ignore_test_files']:
+            skip.append('test')
+        return tuple(skip)
     
-    def _analyze_file(self, file_path: Path):
-        """Analyze single file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def _analyze_file(self, file_path: Union[str, Path], data: Optional[bytes] = None,
+                      config: Optional[Dict[str, Any]] = None):
+        """Analyze single file; data is its already-read contents, if any (config defaults to CONFIG)."""
+        file_str = str(file_path)
+        if data is None:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        # Same text as a utf-8 text-mode read, universal newlines included
+        content = data.decode('utf-8')
+        if b'\r' in data:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         # Update stats
         self.stats['files'] += 1
-        self.stats['lines'] += len(content.splitlines())
+        self.stats['lines'] += _count_source_lines(data, content)
         
         try:
-            tree = ast.parse(content, filename=str(file_path))
-            visitor = IssueVisitor(str(file_path))  # FIXED: Pass full path
+            # ast.parse() minus its Python-level wrapper
+            tree = compile(content, file_str, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            visitor = IssueVisitor(file_str, config)  # FIXED: Pass full path
             visitor.visit(tree)
             
             # Collect results
@@ -104,7 +167,7 @@ class CodeAnalyzer:
             
         except SyntaxError as e:
             self.issues.append(Issue(
-                file_path=str(file_path),  # FIXED: Use full file path
+                file_path=file_str,  # FIXED: Use full file path
                 line_number=e.lineno or 0, 
                 issue_type="syntax_error",
                 message=f"Syntax error: {e.msg}", 
@@ -112,16 +175,39 @@ class CodeAnalyzer:
             ))
 
 
+_FUNC_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+
+# Node fields that hold statement lists, in _fields order. Functions and
+# classes are statements, so they can only be found under these.
+_STMT_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+
 class IssueVisitor(ast.NodeVisitor):
     """AST visitor that finds code issues."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = CONFIG
         self.file_path = file_path  # Store the full file path
         self.issues: List[Issue] = []
+        self._append = self.issues.append
+        # Limits are read once per file instead of once per node
+        self._max_args = config['max_function_args']
+        self._max_length = config['max_function_length']
+        self._max_methods = config['max_class_methods']
+        self._ignore_private = config['ignore_private']
         self.function_count = 0
         self.class_count = 0
         self.current_class = None
     
+    def generic_visit(self, node):
+        """Descend through statement lists only, skipping expression subtrees."""
+        for field in _STMT_FIELDS:
+            children = getattr(node, field, None)
+            if type(children) is list:
+                for child in children:
+                    self.visit(child)
+    
     def visit_FunctionDef(self, node: ast.FunctionDef):
         """Check function issues."""
         self.function_count += 1
@@ -150,12 +236,12 @@ class IssueVisitor(ast.NodeVisitor):
         name = node.name
         
         # Skip private functions if configured
-        if CONFIG['ignore_private'] and name.startswith('_'):
+        if self._ignore_private and name.startswith('_'):
             return
         
         # Missing docstring
         if not ast.get_docstring(node) and not name.startswith('_'):
-            self.issues.append(Issue(
+            self._append(Issue(
                 file_path=self.file_path,  # FIXED: Use stored file path
                 line_number=node.lineno, 
                 issue_type="missing_docstring",
@@ -164,23 +250,23 @@ class IssueVisitor(ast.NodeVisitor):
         
         # Too many arguments
         arg_count = len(node.args.args)
-        if arg_count > CONFIG['max_function_args']:
-            self.issues.append(Issue(
+        if arg_count > self._max_args:
+            self._append(Issue(
                 file_path=self.file_path,  # FIXED: Use stored file path
                 line_number=node.lineno, 
                 issue_type="too_many_args",
-                message=f"Function '{name}' has {arg_count} args (max: {CONFIG['max_function_args']})"
+                message=f"Function '{name}' has {arg_count} args (max: {self._max_args})"
             ))
         
         # Function too long
         if hasattr(node, 'end_lineno'):
             length = node.end_lineno - node.lineno
-            if length > CONFIG['max_function_length']:
-                self.issues.append(Issue(
+            if length > self._max_length:
+                self._append(Issue(
                     file_path=self.file_path,  # FIXED: Use stored file path
                     line_number=node.lineno, 
                     issue_type="long_function",
-                    message=f"Function '{name}' is {length} lines (max: {CONFIG['max_function_length']})",
+                    message=f"Function '{name}' is {length} lines (max: {self._max_length})",
                     severity="info"
                 ))
     
@@ -190,7 +276,7 @@ class IssueVisitor(ast.NodeVisitor):
         
         # Missing docstring
         if not ast.get_docstring(node):
-            self.issues.append(Issue(
+            self._append(Issue(
                 file_path=self.file_path,  # FIXED: Use stored file path
                 line_number=node.lineno, 
                 issue_type="missing_docstring",
@@ -199,17 +285,135 @@ class IssueVisitor(ast.NodeVisitor):
         
         # Count methods
         method_count = sum(1 for child in node.body 
-                          if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)))
+                          if type(child) in _FUNC_TYPES)
         
-        if method_count > CONFIG['max_class_methods']:
-            self.issues.append(Issue(
+        if method_count > self._max_methods:
+            self._append(Issue(
                 file_path=self.file_path,  # FIXED: Use stored file path
                 line_number=node.lineno, 
                 issue_type="too_many_methods",
-                message=f"Class '{name}' has {method_count} methods (max: {CONFIG['max_class_methods']})"
+                message=f"Class '{name}' has {method_count} methods (max: {self._max_methods})"
             ))
 
 
+# Bytes that str.splitlines() treats as line breaks besides \n
+_OTHER_LINE_BREAKS = (b'\r', b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e')
+
+
+def _count_source_lines(data: bytes, content: str) -> int:
+    """len(content.splitlines()), counted on the raw bytes when that gives the same answer."""
+    if data.isascii() and not any(brk in data for brk in _OTHER_LINE_BREAKS):
+        return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+    return len(content.splitlines())
+
+
+def _contains_any(text: str, substrings: Tuple[str, ...]) -> bool:
+    """Whether text contains any of substrings (a plain loop beats any() or a regex here)."""
+    for substring in substrings:
+        if substring in text:
+            return True
+    return False
+
+
+# Per-file analysis: (issues, stats, complete)
+FileOutcome = Tuple[List[Issue], Dict[str, int], bool]
+
+# Below this many files, worker process startup costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+# Files read ahead of the one being parsed when analyzing in-process
+_READ_AHEAD = 8
+
+
+def _read_bytes(file_str: str) -> bytes:
+    """Read a whole file as bytes."""
+    with open(file_str, 'rb') as f:
+        return f.read()
+
+
+def _analyze_one(file_str: str, config: Dict[str, Any],
+                 read_source: Optional[Callable[[], bytes]] = None) -> FileOutcome:
+    """
+    Analyze one file with a fresh CodeAnalyzer under the given settings.
+    
+    Module level so process pool workers can pickle it. config is passed
+    in rather than read from CONFIG, since workers only see its defaults.
+    read_source, if given, returns the file's bytes (raising as a read
+    would). complete is False when the file could not be analyzed and was
+    reported as a parse_error.
+    """
+    analyzer = CodeAnalyzer()
+    try:
+        data = read_source() if read_source is not None else None
+        analyzer._analyze_file(file_str, data, config)
+        complete = True
+    except Exception as e:
+        analyzer.issues.append(Issue(
+            file_path=file_str,  # FIXED: Use full file path
+            line_number=0, 
+            issue_type="parse_error",
+            message=f"Failed to parse: {e}", 
+            severity="error"
+        ))
+        complete = False
+    return analyzer.issues, analyzer.stats, complete
+
+
+def _analyze_many(file_strs: List[str], config: Dict[str, Any]) -> List[FileOutcome]:
+    """
+    Analyze files in order, across worker processes once there are enough of them.
+
+    Called from the controller's and GUI's worker threads; map_in_processes
+    starts its workers without forking this process, so that is safe.
+    """
+    return map_in_processes(functools.partial(_analyze_one, config=config), file_strs,
+                            _PARALLEL_MIN_FILES, chunksize=16,
+                            fallback=functools.partial(_analyze_in_process, config=config))
+
+
+def _analyze_in_process(file_strs: List[str], config: Dict[str, Any]) -> List[FileOutcome]:
+    """Analyze files in order, reading up to _READ_AHEAD files ahead on a helper thread."""
+    if len(file_strs) < 2:
+        return [_analyze_one(file_str, config) for file_str in file_strs]
+    
+    outcomes = []
+    upcoming = iter(file_strs)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="read-ahead") as reader:
+        reads = deque(reader.submit(_read_bytes, file_str)
+                      for _, file_str in zip(range(_READ_AHEAD), upcoming))
+        for file_str in file_strs:
+            read = reads.popleft()
+            next_file = next(upcoming, None)
+            if next_file is not None:
+                reads.append(reader.submit(_read_bytes, next_file))
+            # Parsing holds the GIL, but the file reads release it
+            outcomes.append(_analyze_one(file_str, config, read.result))
+    return outcomes
+
+
+def _cached_outcome(file_str: str, stamp: Optional[Stamp]) -> Optional[FileOutcome]:
+    """Replay a cached file's results if it is unchanged since they were stored."""
+    cached = _FILE_CACHE.get(stamp)
+    if cached is None:
+        return None
+    
+    rows, lines, functions, classes = cached
+    issues = [Issue(file_str, *row) for row in rows]
+    stats = {'files': 1, 'functions': functions, 'classes': classes, 'lines': lines}
+    return issues, stats, True
+
+
+def _store_outcome(stamp: Optional[Stamp], outcome: FileOutcome) -> None:
+    """Cache a freshly analyzed file under the stamp taken before it was read."""
+    issues, stats, complete = outcome
+    if stamp is None or not complete:
+        return
+    # Issues are stored without their path so a hit can be replayed
+    # under whatever spelling of the path this run used
+    rows = [(i.line_number, i.issue_type, i.message, i.severity) for i in issues]
+    _FILE_CACHE.put(stamp, (rows, stats['lines'], stats['functions'], stats['classes']))
+
+
 # Simple public API
 def analyze_project(project_path: str) -> Dict[str, Any]:
     """Analyze project and return results."""
@@ -217,7 +421,13 @@ def analyze_project(project_path: str) -> Dict[str, Any]:
     return analyzer.analyze_project(project_path)
 
 
-def format_summary(results: Dict[str, Any]) -> str:
+def count_by_severity(issues: List[Issue]) -> Counter:
+    """Count issues per severity in a single pass."""
+    return Counter(issue.severity for issue in issues)
+
+
+def format_summary(results: Dict[str, Any],
+                   severity_counts: Optional[Counter] = None) -> str:
     """Create simple text summary."""
     issues = results['issues']
     
@@ -233,18 +443,14 @@ def format_summary(results: Dict[str, Any]) -> str:
         lines.append("🎉 No issues found!")
         return "\n".join(lines)
     
-    # Group by severity
-    by_severity = {}
-    for issue in issues:
-        severity = issue.severity
-        if severity not in by_severity:
-            by_severity[severity] = []
-        by_severity[severity].append(issue)
+    # Count by severity
+    if severity_counts is None:
+        severity_counts = count_by_severity(issues)
     
     # Show summary
-    for severity in ['error', 'warning', 'info']:
-        if severity in by_severity:
-            count = len(by_severity[severity])
+    for severity in ('error', 'warning', 'info'):
+        count = severity_counts[severity]
+        if count:
             lines.append(f"{severity.upper()}: {count}")
     
     lines.append("\nTop Issues:")
@@ -264,8 +470,6 @@ def format_summary(results: Dict[str, Any]) -> str:
 
 # CLI interface (if run directly)
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) != 2:
         print("Usage: python code_analyzer.py <project_path>")
         sys.exit(1)
@@ -275,8 +479,8 @@ if __name__ == "__main__":
         print(format_summary(results))
         
         # Exit with error code if issues found
-        errors = [i for i in results['issues'] if i.severity == 'error']
-        sys.exit(1 if errors else 0)
+        has_error = any(i.severity == 'error' for i in results['issues'])
+        sys.exit(1 if has_error else 0)
         
     except Exception as e:
         print(f"Analysis failed: {e}")
@@ -4,15 +4,147 @@ Codebase Discovery
 Purpose: Quickly understand unfamiliar codebases - frameworks, entry points, structure
 """
 
+import functools
+import heapq
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 
+from functions._filecache import FileCache, file_stamp
+from functions._fswalk import iter_py_files
+from functions._procpool import map_in_processes
+
 from utils.codebase_patterns import FRAMEWORK_PATTERNS, BUSINESS_PATTERNS, EXTERNAL_SERVICE_PATTERNS
 
-@dataclass
+try:
+    import ahocorasick  # Optional: match all patterns in one pass per file
+except ImportError:
+    ahocorasick = None
+
+# slots drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_automatons() -> Optional[Tuple[Any, Any, Any]]:
+    """Aho-Corasick automatons for the framework, business and service patterns, built once."""
+    if ahocorasick is None:
+        return None
+    
+    automatons = []
+    for table in (FRAMEWORK_PATTERNS, BUSINESS_PATTERNS, EXTERNAL_SERVICE_PATTERNS):
+        automaton = ahocorasick.Automaton()
+        for needle in {needle for needles in table.values() for needle in needles}:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        automatons.append(automaton)
+    return tuple(automatons)
+
+
+# Per-file scan: (entry confidence, framework score increments, business pattern names, services)
+FileScan = Tuple[float, List[Tuple[str, float]], List[str], List[str]]
+
+# Below this many files, worker process startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Persistent per-file scans: abs path -> (mtime, size, FileScan)
+_SCAN_CACHE = FileCache('discovery_cache.pickle', 1)
+
+# Entry point signals
+_ENTRY_FILENAMES = frozenset(('main.py', 'app.py', 'run.py', 'server.py', 'manage.py'))
+_RUN_CALL_RE = re.compile(r'\.run\s*\(')
+
+
+def _scan_file(file_str: str) -> Optional[FileScan]:
+    """
+    Run every detector over one file, or return None if it can't be read.
+    
+    Module level so process pool workers can pickle it. The file is read
+    once; entry point, framework and service checks run on its text and
+    business patterns on its lower-cased text.
+    
+    With pyahocorasick installed, each pattern table is matched in a
+    single pass and the checks below test membership in the set of
+    patterns found; otherwise they test substrings of the text directly.
+    """
+    try:
+        with open(file_str, 'rb') as f:
+            data = f.read()
+    except Exception:
+        return None
+    
+    # Same text as a lenient utf-8 text-mode read, universal newlines included;
+    # strict decoding is the fast path and almost every file is valid utf-8
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError:
+        content = data.decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    automatons = _pattern_automatons()
+    lower_content = content.lower()
+    if automatons is not None:
+        framework_hits = {needle for _, needle in automatons[0].iter(content)}
+        business_hits = {needle for _, needle in automatons[1].iter(lower_content)}
+        service_hits = {needle for _, needle in automatons[2].iter(content)}
+    else:
+        framework_hits = service_hits = content
+        business_hits = lower_content
+    
+    confidence = _entry_confidence(os.path.basename(file_str), content)
+    
+    # Frameworks - score based on pattern matches
+    framework_scores = []
+    for framework, patterns in FRAMEWORK_PATTERNS.items():
+        matches = sum(1 for pattern in patterns if pattern in framework_hits)
+        if matches > 0:
+            framework_scores.append((framework, min(matches / len(patterns), 1.0)))
+    
+    # Business patterns - at least one keyword match
+    business = [pattern_name for pattern_name, keywords in BUSINESS_PATTERNS.items()
+                if any(keyword in business_hits for keyword in keywords)]
+    
+    # External services
+    services = [service for service, patterns in EXTERNAL_SERVICE_PATTERNS.items()
+                if any(pattern in service_hits for pattern in patterns)]
+    
+    return confidence, framework_scores, business, services
+
+
+def _entry_confidence(filename: str, content: str) -> float:
+    """Calculate how likely a file is an entry point."""
+    confidence = 0.0
+    
+    # Main guard pattern
+    if 'if __name__ == "__main__":' in content:
+        confidence += 0.6
+    
+    # Entry point filenames
+    if filename.lower() in _ENTRY_FILENAMES:
+        confidence += 0.4
+    
+    # Application server patterns
+    if _RUN_CALL_RE.search(content):
+        confidence += 0.3
+    
+    # CLI argument handling
+    if 'argparse' in content or 'sys.argv' in content:
+        confidence += 0.2
+    
+    return min(confidence, 1.0)
+
+
+def _patterns_key() -> str:
+    """Fingerprint of the pattern tables, so editing them invalidates cached scans."""
+    return repr((FRAMEWORK_PATTERNS, BUSINESS_PATTERNS, EXTERNAL_SERVICE_PATTERNS))
+
+
+@dataclass(**_SLOTS)
 class DiscoveryResult:
     """Results from codebase discovery."""
     entry_points: List[Dict[str, Any]]
@@ -26,7 +158,8 @@ class DiscoveryResult:
 class CodebaseDiscovery:
     """Fast codebase understanding tool."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache  # Reuse scans of files unchanged since the last run
         self.excluded_dirs = {
             '__pycache__', '.git', '.pytest_cache', '.venv', 'venv', 'env',
             'node_modules', '.tox', 'build', 'dist'
@@ -46,10 +179,7 @@ class CodebaseDiscovery:
         print(f"🔍 Analyzing {len(python_files)} Python files...")
         
         # Run all detection
-        entry_points = self._find_entry_points(python_files)
-        frameworks = self._detect_frameworks(python_files)
-        business_patterns = self._detect_business_patterns(python_files)
-        external_services = self._detect_external_services(python_files)
+        entry_points, frameworks, business_patterns, external_services = self._scan_files(python_files)
         
         # Generate insights and guidance
         quick_start = self._generate_quick_start(entry_points, frameworks)
@@ -69,7 +199,7 @@ class CodebaseDiscovery:
         """Get Python files, excluding common build/cache directories."""
         python_files = []
         
-        for file_path in project_path.rglob("*.py"):
+        for file_path in map(Path, iter_py_files(str(project_path), exclude_dirs=self.excluded_dirs)):
             # Skip excluded directories
             if any(excluded in file_path.parts for excluded in self.excluded_dirs):
                 continue
@@ -77,115 +207,74 @@ class CodebaseDiscovery:
         
         return python_files
     
-    def _find_entry_points(self, python_files: List[Path]) -> List[Dict[str, Any]]:
-        """Find likely application entry points."""
+    def _scan_files(self, python_files: List[Path]) -> Tuple[List[Dict[str, Any]], Dict[str, float],
+                                                             Dict[str, List[str]], List[str]]:
+        """
+        Run every detector over the project and merge the per-file scans.
+        
+        Scans of files unchanged since an earlier run are replayed from the
+        disk cache; the rest are scanned across worker processes once there
+        are enough of them. Scans are merged in file order, so results match
+        a serial run. Returns (entry_points, frameworks, business_patterns, external_services).
+        """
         entry_points = []
+        framework_scores = defaultdict(float)
+        pattern_files = defaultdict(set)
+        services_found = set()
+        
+        file_strs = [str(file_path) for file_path in python_files]
+        scans = [None] * len(file_strs)
+        stamps = [None] * len(file_strs)
+        if self.use_cache:
+            _SCAN_CACHE.load(_patterns_key())
+            for index, file_str in enumerate(file_strs):
+                stamps[index] = file_stamp(file_str)
+                scans[index] = _SCAN_CACHE.get(stamps[index])
         
-        for file_path in python_files:
-            confidence = self._calculate_entry_confidence(file_path)
+        pending = [index for index, scan in enumerate(scans) if scan is None]
+        fresh = map_in_processes(_scan_file, [file_strs[index] for index in pending],
+                                 _PARALLEL_MIN_FILES, chunksize=32)
+        for index, scan in zip(pending, fresh):
+            scans[index] = scan
+            if self.use_cache and scan is not None:
+                _SCAN_CACHE.put(stamps[index], scan)
+        if self.use_cache:
+            _SCAN_CACHE.save()
+        
+        for file_path, scan in zip(python_files, scans):
+            if scan is None:
+                continue
+            confidence, file_frameworks, file_business, file_services = scan
+            
+            # Entry points
             if confidence > 0.3:
                 entry_points.append({
                     'filename': file_path.name,
                     'file_path': str(file_path),
                     'confidence': confidence
                 })
+            
+            for framework, score in file_frameworks:
+                framework_scores[framework] += score
+            for pattern_name in file_business:
+                pattern_files[pattern_name].add(file_path.name)
+            services_found.update(file_services)
         
-        # Sort by confidence and return top 5
-        entry_points.sort(key=lambda x: x['confidence'], reverse=True)
-        return entry_points[:5]
-    
-    def _calculate_entry_confidence(self, file_path: Path) -> float:
-        """Calculate how likely this file is an entry point."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-        except Exception:
-            return 0.0
-        
-        confidence = 0.0
-        
-        # Main guard pattern
-        if 'if __name__ == "__main__":' in content:
-            confidence += 0.6
-        
-        # Entry point filenames
-        filename = file_path.name.lower()
-        if filename in ['main.py', 'app.py', 'run.py', 'server.py', 'manage.py']:
-            confidence += 0.4
-        
-        # Application server patterns
-        if re.search(r'\.run\s*\(', content):
-            confidence += 0.3
-        
-        # CLI argument handling
-        if 'argparse' in content or 'sys.argv' in content:
-            confidence += 0.2
-        
-        return min(confidence, 1.0)
-    
-    def _detect_frameworks(self, python_files: List[Path]) -> Dict[str, float]:
-        """Detect frameworks used in the project."""
-        framework_scores = defaultdict(float)
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Check each framework
-                for framework, patterns in FRAMEWORK_PATTERNS.items():
-                    matches = sum(1 for pattern in patterns if pattern in content)
-                    if matches > 0:
-                        # Score based on pattern matches
-                        framework_scores[framework] += min(matches / len(patterns), 1.0)
-            except Exception:
-                continue
+        # Keep the 5 most confident entry points (ties stay in file order)
+        top_entry_points = heapq.nlargest(5, entry_points, key=lambda x: x['confidence'])
         
-        # Normalize scores and filter significant ones
+        # Normalize framework scores and filter significant ones
         total_files = len(python_files)
-        return {
+        frameworks = {
             framework: score / total_files 
             for framework, score in framework_scores.items() 
             if score > 0.2
         }
-    
-    def _detect_business_patterns(self, python_files: List[Path]) -> Dict[str, List[str]]:
-        """Detect business logic patterns."""
-        pattern_files = defaultdict(set)
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
-                
-                # Check each business pattern
-                for pattern_name, keywords in BUSINESS_PATTERNS.items():
-                    matches = sum(1 for keyword in keywords if keyword in content)
-                    if matches >= 1:  # At least one match
-                        pattern_files[pattern_name].add(file_path.name)
-            except Exception:
-                continue
         
-        # Return with limited file lists
-        return {k: list(v)[:3] for k, v in pattern_files.items() if v}
-    
-    def _detect_external_services(self, python_files: List[Path]) -> List[str]:
-        """Detect external service integrations."""
-        services_found = set()
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Check each service pattern
-                for service, patterns in EXTERNAL_SERVICE_PATTERNS.items():
-                    if any(pattern in content for pattern in patterns):
-                        services_found.add(service)
-            except Exception:
-                continue
+        # Business patterns with limited file lists
+        business_patterns = {k: list(v)[:3] for k, v in pattern_files.items() if v}
         
-        return sorted(services_found)
+        return top_entry_points, frameworks, business_patterns, sorted(services_found)
     
     def _generate_quick_start(self, entry_points: List[Dict], frameworks: Dict[str, float]) -> List[str]:
         """Generate quick start instructions."""
@@ -7,12 +7,19 @@ Purpose: Analyze dependencies
 import ast
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 
+from functions._filecache import FileCache, Stamp, file_stamp
+from functions._fswalk import iter_py_files
+from functions._procpool import map_in_processes
 
-@dataclass
+# slots drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class DependencyIssue:
     """Simple dependency issue container."""
     file: str
@@ -23,20 +30,42 @@ class DependencyIssue:
 
 
 # Standard library modules
-STDLIB_MODULES = {
+STDLIB_MODULES = frozenset({
     'os', 'sys', 'json', 'csv', 'datetime', 'pathlib', 'typing', 'collections',
     'itertools', 'functools', 're', 'math', 'random', 'subprocess', 'threading',
     'asyncio', 'unittest', 'logging', 'argparse', 'urllib', 'http', 'socket'
-}
+}.union(getattr(sys, 'stdlib_module_names', ())))
+
+# Path substrings of directories that are never analyzed
+_SKIP_DIRS = ('__pycache__', '.git', '.venv', 'venv', 'env', 'build', 'dist')
+
+# Below this many files, worker process startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Per-file analysis: (imports, unused (module_name, line_number) pairs, issues)
+FileImports = Tuple[List[str], List[Tuple[str, int]], List[DependencyIssue]]
+
+# Persistent per-file analysis: abs path -> (mtime, size, (path as given, FileImports)).
+# Bump the version when the content checks in _is_likely_used change
+_IMPORT_CACHE = FileCache('dependency_cache.pickle', 2)
+
+# Top-level packages whose dotted imports are treated as submodule imports (import x.y)
+_COMMON_SUBMODULES = ('os.path', 'sys.argv', 'json.loads', 'urllib.request')
 
-if hasattr(sys, 'stdlib_module_names'):
-    STDLIB_MODULES.update(sys.stdlib_module_names)
+# Modules whose imports are often used implicitly, so never reported as unused
+_FRAMEWORK_MODULES = ('typing', 'dataclasses', 'abc', 'enum', 'pytest', 'unittest', 'logging')
+
+
+def _usage_key() -> str:
+    """Fingerprint of the unused-import heuristics, so editing them invalidates cached analyses."""
+    return repr((_COMMON_SUBMODULES, _FRAMEWORK_MODULES))
 
 
 class DependencyAnalyzer:
     """Streamlined dependency analyzer."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache  # Reuse analyses of files unchanged since the last run
         self.issues: List[DependencyIssue] = []
         self.all_imports: Dict[str, Set[str]] = defaultdict(set)
         self.unused_imports: List[Dict[str, Any]] = []
@@ -47,62 +76,61 @@ class DependencyAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"Project path not found: {project_path}")
         
-        python_files = [f for f in path.rglob("*.py") if self._should_analyze(f)]
+        python_files = [
+            f for f in map(Path, iter_py_files(str(path), _SKIP_DIRS))
+            if self._should_analyze(f)
+        ]
         if not python_files:
             return self._empty_results()
         
-        for file_path in python_files:
-            try:
-                self._analyze_file(file_path)
-            except Exception as e:
-                self.issues.append(DependencyIssue(
-                    file=str(file_path), line=0, type="parse_error",
-                    message=f"Failed to parse: {e}", severity="error"
-                ))
+        file_strs = [str(file_path) for file_path in python_files]
+        outcomes = [None] * len(file_strs)
+        stamps = [None] * len(file_strs)
+        if self.use_cache:
+            _IMPORT_CACHE.load(_usage_key())
+            for index, file_str in enumerate(file_strs):
+                stamps[index] = file_stamp(file_str)
+                outcomes[index] = _cached_imports(file_str, stamps[index])
         
-        return self._compile_results(len(python_files))
-    
-    def _should_analyze(self, file_path: Path) -> bool:
-        """Quick file filtering."""
-        file_str = str(file_path).lower()
-        skip_dirs = {'__pycache__', '.git', '.venv', 'venv', 'env', 'build', 'dist'}
-        return not any(skip_dir in file_str for skip_dir in skip_dirs)
-    
-    def _analyze_file(self, file_path: Path):
-        """Analyze single file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=str(file_path))
-            visitor = SmartImportVisitor(str(file_path), content)
-            visitor.visit(tree)
-            
+        pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        fresh = map_in_processes(_analyze_file, [file_strs[index] for index in pending],
+                                 _PARALLEL_MIN_FILES, chunksize=32)
+        for index, outcome in zip(pending, fresh):
+            outcomes[index] = outcome
+            if self.use_cache:
+                _store_imports(file_strs[index], stamps[index], outcome)
+        if self.use_cache:
+            _IMPORT_CACHE.save()
+        
+        for file_str, (imports, unused, issues) in zip(file_strs, outcomes):
             # Record imports
-            for import_name in visitor.imports:
-                self.all_imports[import_name].add(str(file_path))
+            for import_name in imports:
+                self.all_imports[import_name].add(file_str)
             
-            # Find unused with smart filtering
-            unused = visitor.get_unused_imports()
-            for unused_import in unused:
+            for module_name, line_number in unused:
                 self.unused_imports.append({
-                    'module_name': unused_import,
-                    'file_path': str(file_path),
-                    'line_number': visitor.import_lines.get(unused_import, 0)
+                    'module_name': module_name,
+                    'file_path': file_str,
+                    'line_number': line_number
                 })
             
-            self.issues.extend(visitor.issues)
-            
-        except SyntaxError as e:
-            self.issues.append(DependencyIssue(
-                file=str(file_path), line=e.lineno or 0, type="syntax_error",
-                message=f"Syntax error: {e.msg}", severity="error"
-            ))
+            self.issues.extend(issues)
+        
+        return self._compile_results(len(python_files))
+    
+    def _should_analyze(self, file_path: Path) -> bool:
+        """Quick file filtering."""
+        file_str = str(file_path).lower()
+        return not any(skip_dir in file_str for skip_dir in _SKIP_DIRS)
     
     def _compile_results(self, files_analyzed: int) -> Dict[str, Any]:
         """Compile final results."""
-        stdlib_count = sum(1 for imp in self.all_imports.keys() if self._is_stdlib(imp))
-        third_party_count = sum(1 for imp in self.all_imports.keys() if self._is_third_party(imp))
+        stdlib_count = third_party_count = 0
+        for imp in self.all_imports:
+            if self._is_stdlib(imp):
+                stdlib_count += 1
+            elif not imp.startswith('.'):
+                third_party_count += 1
         local_count = len(self.all_imports) - stdlib_count - third_party_count
         
         risk_level = "HIGH" if third_party_count > 50 else "MEDIUM" if third_party_count > 20 else "LOW"
@@ -129,7 +157,7 @@ class DependencyAnalyzer:
     
     def _is_stdlib(self, module_name: str) -> bool:
         """Check if module is standard library."""
-        return module_name.split('.')[0] in STDLIB_MODULES
+        return module_name.partition('.')[0] in STDLIB_MODULES
     
     def _is_third_party(self, module_name: str) -> bool:
         """Check if module is third-party."""
@@ -166,7 +194,7 @@ class DependencyAnalyzer:
         }
 
 
-class SmartImportVisitor(ast.NodeVisitor):
+class SmartImportVisitor:
     """Smart visitor with ONLY the tkinter alias fix - no other changes."""
     
     def __init__(self, file_path: str, content: str):
@@ -178,6 +206,38 @@ class SmartImportVisitor(ast.NodeVisitor):
         self.used_names: Set[str] = set()
         self.issues: List[DependencyIssue] = []
     
+    def visit(self, tree: ast.AST):
+        """
+        Collect used names and imports in one pass over the tree.
+        
+        An explicit stack avoids NodeVisitor's per-node method dispatch.
+        Names are leaves and any name an attribute is taken on is itself a
+        Name node, so Names are the only usage to record. Imports are then
+        handled in source order, which is the order a depth-first visit
+        would have reached them in.
+        """
+        import_nodes = []
+        add_name = self.used_names.add
+        iter_children = ast.iter_child_nodes
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.Name:
+                add_name(node.id)
+                continue
+            if node_type is ast.Import or node_type is ast.ImportFrom:
+                import_nodes.append(node)
+                continue
+            stack.extend(iter_children(node))
+        
+        import_nodes.sort(key=lambda node: (node.lineno, node.col_offset))
+        for node in import_nodes:
+            if type(node) is ast.Import:
+                self.visit_Import(node)
+            else:
+                self.visit_ImportFrom(node)
+    
     def visit_Import(self, node: ast.Import):
         """Handle import statements - ONLY CHANGE: track aliases properly."""
         for alias in node.names:
@@ -188,8 +248,6 @@ class SmartImportVisitor(ast.NodeVisitor):
             # ONLY CHANGE: If there's an alias, track it
             if alias.asname:
                 self.import_aliases[alias.name] = alias.asname
-        
-        self.generic_visit(node)
     
     def visit_ImportFrom(self, node: ast.ImportFrom):
         """Handle from...import statements."""
@@ -205,18 +263,6 @@ class SmartImportVisitor(ast.NodeVisitor):
                 full_name = f"{module}.{alias.name}" if module else alias.name
                 self.imports.add(full_name)
                 self.import_lines[full_name] = node.lineno
-        self.generic_visit(node)
-    
-    def visit_Name(self, node: ast.Name):
-        """Track name usage."""
-        self.used_names.add(node.id)
-        self.generic_visit(node)
-    
-    def visit_Attribute(self, node: ast.Attribute):
-        """Track attribute usage like os.path."""
-        if isinstance(node.value, ast.Name):
-            self.used_names.add(node.value.id)
-        self.generic_visit(node)
     
     def get_unused_imports(self) -> Set[str]:
         """Get unused imports - ONLY CHANGE: check aliases."""
@@ -246,8 +292,7 @@ class SmartImportVisitor(ast.NodeVisitor):
     def _looks_like_submodule(self, module_path: str) -> bool:
         """Check if this looks like a submodule import (import x.y)."""
         # Simple heuristic: if it's a common pattern like os.path, sys.argv, etc.
-        common_submodules = ['os.path', 'sys.argv', 'json.loads', 'urllib.request']
-        return any(module_path.startswith(sub.split('.')[0]) for sub in common_submodules)
+        return any(module_path.startswith(sub.split('.')[0]) for sub in _COMMON_SUBMODULES)
     
     def _is_likely_used(self, check_name: str, full_module: str) -> bool:
         """Smart content-based detection - UNCHANGED."""
@@ -270,11 +315,7 @@ class SmartImportVisitor(ast.NodeVisitor):
             return True
         
         # 3. Framework patterns that cause false positives
-        framework_patterns = {
-            'typing', 'dataclasses', 'abc', 'enum', 'pytest', 'unittest', 'logging'
-        }
-        
-        if any(fw in full_module for fw in framework_patterns):
+        if any(fw in full_module for fw in _FRAMEWORK_MODULES):
             return True
         
         # 4. Test files are more lenient
@@ -284,6 +325,54 @@ class SmartImportVisitor(ast.NodeVisitor):
         return False
 
 
+def _analyze_file(file_str: str) -> FileImports:
+    """
+    Analyze a single file's imports.
+    
+    Module level so process pool workers can pickle it. Files that can't
+    be read or parsed come back with no imports and a single issue.
+    """
+    try:
+        with open(file_str, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        tree = ast.parse(content, filename=file_str)
+        visitor = SmartImportVisitor(file_str, content)
+        visitor.visit(tree)
+        
+        # Find unused with smart filtering
+        unused = [(unused_import, visitor.import_lines.get(unused_import, 0))
+                  for unused_import in visitor.get_unused_imports()]
+        return list(visitor.imports), unused, visitor.issues
+    
+    except SyntaxError as e:
+        return [], [], [DependencyIssue(
+            file=file_str, line=e.lineno or 0, type="syntax_error",
+            message=f"Syntax error: {e.msg}", severity="error"
+        )]
+    except Exception as e:
+        return [], [], [DependencyIssue(
+            file=file_str, line=0, type="parse_error",
+            message=f"Failed to parse: {e}", severity="error"
+        )]
+
+
+def _cached_imports(file_str: str, stamp: Optional[Stamp]) -> Optional[FileImports]:
+    """Replay a cached file's analysis if it is unchanged and was analyzed under the same path."""
+    cached = _IMPORT_CACHE.get(stamp)
+    # Issues and test-file leniency use the path as given, so only reuse the same spelling
+    if cached is None or cached[0] != file_str:
+        return None
+    return cached[1]
+
+
+def _store_imports(file_str: str, stamp: Optional[Stamp], outcome: FileImports) -> None:
+    """Cache a freshly analyzed file, unless it couldn't be read."""
+    if any(issue.type == "parse_error" for issue in outcome[2]):
+        return
+    _IMPORT_CACHE.put(stamp, (file_str, outcome))
+
+
 # Simple public API
 def analyze_project(project_path: str) -> Dict[str, Any]:
     """Analyze project dependencies."""
@@ -4,34 +4,87 @@ Issues Formatter
 Handles all issues display and filtering logic
 """
 
+import os
+from collections import Counter
 from pathlib import Path
 from typing import List, Any
 
 
+_SEVERITY_ICONS = {
+    "critical": "🔴", "high": "🟠", "error": "❌", "warning": "⚠️",
+    "medium": "🟡", "info": "ℹ️", "low": "🔵"
+}
+
+
+class _IssueIndex:
+    """Column-wise view of an issue list, built in a single pass.
+    
+    The GUI calls the functions below repeatedly on the same list (every
+    filter change or keystroke), so the per-issue getattr work is done
+    once and reused while the list is unchanged.
+    """
+    
+    __slots__ = ("issues", "size", "severities", "types", "_haystacks")
+    
+    def __init__(self, issues: List[Any]):
+        self.issues = issues
+        self.size = len(issues)
+        self.severities = []
+        self.types = []
+        for issue in issues:
+            self.severities.append(getattr(issue, "severity", "unknown"))
+            self.types.append(getattr(issue, "issue_type", getattr(issue, "type", "unknown")))
+        self._haystacks = None
+    
+    @property
+    def haystacks(self) -> List[str]:
+        """Lower-cased searchable text per issue, built on the first search."""
+        if self._haystacks is None:
+            self._haystacks = [_search_text(issue) for issue in self.issues]
+        return self._haystacks
+
+
+_index_cache = None
+
+
+def _issue_index(issues: List[Any]) -> _IssueIndex:
+    """Return the column index for issues, rebuilding it when the list changes."""
+    global _index_cache
+    index = _index_cache
+    if index is None or index.issues is not issues or index.size != len(issues):
+        index = _index_cache = _IssueIndex(issues)
+    return index
+
+
 def get_severity_options(issues: List[Any]) -> List[str]:
     """Get available severity options from issues."""
     if not issues:
         return ["all"]
     
-    severities = set(getattr(issue, "severity", "unknown") for issue in issues)
+    severities = set(_issue_index(issues).severities)
     return ["all"] + sorted(severities)
 
 
 def filter_issues(issues: List[Any], severity_filter: str = "all", search_term: str = "") -> List[Any]:
     """Filter issues by severity and search term."""
-    filtered = issues
+    if severity_filter == "all" and not search_term:
+        return issues
+    
+    index = _issue_index(issues)
+    selected = range(index.size)
     
     # Apply severity filter
     if severity_filter != "all":
-        filtered = [issue for issue in filtered 
-                   if getattr(issue, "severity", "unknown") == severity_filter]
+        severities = index.severities
+        selected = [i for i in selected if severities[i] == severity_filter]
     
     # Apply search filter
     if search_term:
         search_lower = search_term.lower()
-        filtered = [issue for issue in filtered if _issue_matches_search(issue, search_lower)]
+        haystacks = index.haystacks
+        selected = [i for i in selected if search_lower in haystacks[i]]
     
-    return filtered
+    return [issues[i] for i in selected]
 
 
 def format_issues_for_display(issues: List[Any], show_limit: int = 100) -> str:
@@ -39,11 +92,6 @@ def format_issues_for_display(issues: List[Any], show_limit: int = 100) -> str:
     if not issues:
         return "🎉 No issues found! Your code looks great!"
     
-    severity_icons = {
-        "critical": "🔴", "high": "🟠", "error": "❌", "warning": "⚠️",
-        "medium": "🟡", "info": "ℹ️", "low": "🔵"
-    }
-    
     lines = [f"🐛 ISSUES FOUND ({len(issues)} total)", "=" * 60, ""]
     
     for i, issue in enumerate(issues[:show_limit], 1):
@@ -53,14 +101,14 @@ def format_issues_for_display(issues: List[Any], show_limit: int = 100) -> str:
         line_num = getattr(issue, "line_number", getattr(issue, "line", 0))
         issue_type = getattr(issue, "issue_type", getattr(issue, "type", "unknown"))
         
-        icon = severity_icons.get(severity, "⚪")
-        file_name = Path(file_path).name if file_path != "Unknown" else "Unknown"
+        icon = _SEVERITY_ICONS.get(severity, "⚪")
+        file_name = _file_name(file_path) if file_path != "Unknown" else "Unknown"
         
-        lines.extend([
+        lines.extend((
             f"{i}. {icon} {severity.upper()}: {message}",
             f"   📄 {file_name}:{line_num} ({issue_type})",
             ""
-        ])
+        ))
     
     if len(issues) > show_limit:
         lines.append(f"... and {len(issues) - show_limit} more issues")
@@ -73,21 +121,10 @@ def get_issue_statistics(issues: List[Any]) -> str:
     if not issues:
         return "No issues to analyze"
     
-    severity_icons = {
-        "critical": "🔴", "high": "🟠", "error": "❌", "warning": "⚠️",
-        "medium": "🟡", "info": "ℹ️", "low": "🔵"
-    }
-    
-    # Count by severity
-    by_severity = {}
-    by_type = {}
-    
-    for issue in issues:
-        severity = getattr(issue, "severity", "unknown")
-        issue_type = getattr(issue, "issue_type", getattr(issue, "type", "unknown"))
-        
-        by_severity[severity] = by_severity.get(severity, 0) + 1
-        by_type[issue_type] = by_type.get(issue_type, 0) + 1
+    # Count by severity and type
+    index = _issue_index(issues)
+    by_severity = Counter(index.severities)
+    by_type = Counter(index.types)
     
     stats_parts = []
     
@@ -97,7 +134,7 @@ def get_issue_statistics(issues: List[Any]) -> str:
         for severity in ["critical", "high", "error", "warning", "medium", "info", "low"]:
             count = by_severity.get(severity, 0)
             if count > 0:
-                icon = severity_icons.get(severity, "⚪")
+                icon = _SEVERITY_ICONS.get(severity, "⚪")
                 severity_stats.append(f"{icon} {severity}: {count}")
         
         if severity_stats:
@@ -105,20 +142,29 @@ def get_issue_statistics(issues: List[Any]) -> str:
     
     # Top issue types
     if by_type:
-        top_types = sorted(by_type.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_types = by_type.most_common(3)
         type_stats = [f"{issue_type}: {count}" for issue_type, count in top_types]
         stats_parts.append(f"Top types: {', '.join(type_stats)}")
     
     return " • ".join(stats_parts) if stats_parts else "No detailed statistics available"
 
 
-def _issue_matches_search(issue: Any, search_lower: str) -> bool:
-    """Check if issue matches search term."""
+def _file_name(file_path: str) -> str:
+    """Path(file_path).name via plain string splitting for ordinary file paths."""
+    name = file_path.rpartition(os.sep)[2]
+    if os.altsep:
+        name = name.rpartition(os.altsep)[2]
+    # Trailing separators and '.' components need pathlib's normalization
+    if not name or name == ".":
+        return Path(file_path).name
+    return name
+
+
+def _search_text(issue: Any) -> str:
+    """Build the lower-cased text a search term is matched against."""
     # Search in various fields
-    searchable_text = " ".join([
+    return " ".join([
         getattr(issue, "message", "").lower(),
         getattr(issue, "file_path", getattr(issue, "file", "")).lower(),
         getattr(issue, "issue_type", getattr(issue, "type", "")).lower()
-    ])
-    
-    return search_lower in searchable_text
\ No newline at end of file
+    ])
\ No newline at end of file
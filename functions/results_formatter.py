@@ -4,46 +4,64 @@ Results Formatter
 Handles all result display formatting logic
 """
 
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Union
 from functions.analysis_controller import AnalysisResults
 
+# Shared read-only default for missing nested result sections
+_EMPTY = MappingProxyType({})
+
+# Write buffer for text report exports
+_SAVE_BUFFER_SIZE = 1 << 20
+
+
 def format_results_for_display(results: AnalysisResults) -> str:
     """Format results for display in GUI or CLI."""
     if not results or not results.success:
         return "❌ No results to display or analysis failed."
     
+    return "\n".join(_build_result_lines(results))
+
+
+def _build_result_lines(results: AnalysisResults) -> List[str]:
+    """Build the display report for successful results as a list of lines."""
+    data = results.results
+    meta = data.get('analysis_metadata') or _EMPTY
+    
     lines = [
         "🎯 CODE ANALYSIS RESULTS",
         "=" * 60,
-        f"📁 Project: {results.results.get('analysis_metadata', {}).get('project_path', 'Unknown')}",
+        f"📁 Project: {meta.get('project_path', 'Unknown')}",
         f"📊 Total Issues: {len(results.issues)}",
         f"🔧 Modules Used: {', '.join(results.modules_used or [])}",
-        f"⏱️ Analysis Time: {results.results.get('analysis_metadata', {}).get('timestamp', 'Unknown')}",
+        f"⏱️ Analysis Time: {meta.get('timestamp', 'Unknown')}",
         "",
     ]
     
     # Add sections based on what was actually analyzed
     sections_added = 0  
     # Code Analysis section
-    if "total_files" in results.results:
-        lines.extend(_format_code_analysis_section(results.results))
+    if "total_files" in data:
+        _format_code_analysis_section(lines, data)
         sections_added += 1    
     # Security Analysis section  
-    if "security_scan" in results.results:
-        lines.extend(_format_security_section(results.results["security_scan"]))
+    if "security_scan" in data:
+        _format_security_section(lines, data["security_scan"])
         sections_added += 1    
     # Dependency Analysis section
-    if "dependencies" in results.results:
-        lines.extend(_format_dependency_section(results.results["dependencies"]))
+    if "dependencies" in data:
+        _format_dependency_section(lines, data["dependencies"])
         sections_added += 1    
     # Codebase Discovery section
-    if "legacy_analysis" in results.results:
-        lines.extend(_format_discovery_section(results.results["legacy_analysis"]))
+    if "legacy_analysis" in data:
+        _format_discovery_section(lines, data["legacy_analysis"])
         sections_added += 1    
     # Git Integration section
-    if "git_info" in results.results:
-        lines.extend(_format_git_section(results.results["git_info"]))
+    if "git_info" in data:
+        _format_git_section(lines, data["git_info"])
         sections_added += 1
     
     # Add summary footer
@@ -54,24 +72,32 @@ def format_results_for_display(results: AnalysisResults) -> str:
     ])
     
     # Add recommendations
-    lines.extend(_format_recommendations(results.issues))    
-    return "\n".join(lines)
+    _format_recommendations(lines, results.issues)
+    return lines
 
 
-def save_results_to_file(results: AnalysisResults, filename: str) -> None:
+def save_results_to_file(results: AnalysisResults, filename: Union[str, Path]) -> None:
     """Save results to file - handles different formats."""
+    filename = os.fspath(filename)
     if filename.lower().endswith('.json'):
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(results.to_json())
+        with open(filename, "wb") as f:
+            f.write(results.to_json_bytes())
+    elif not results or not results.success:
+        with open(filename, "wb") as f:
+            f.write(format_results_for_display(results).encode("utf-8"))
     else:
-        formatted_text = format_results_for_display(results)
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(formatted_text)
-
-
-def _format_code_analysis_section(results: Dict) -> List[str]:
-    """Format code analysis section."""
-    return [
+        # Encode and write line by line through a large buffer instead of
+        # joining and encoding the whole report first
+        lines = _build_result_lines(results)
+        with open(filename, "wb", buffering=_SAVE_BUFFER_SIZE) as f:
+            f.write(lines[0].encode("utf-8"))
+            for line in lines[1:]:
+                f.write(b"\n" + line.encode("utf-8"))
+
+
+def _format_code_analysis_section(lines: List[str], results: Dict) -> None:
+    """Append the code analysis section to lines."""
+    lines.extend((
         "📋 CODE ANALYSIS",
         "-" * 30,
         f"📄 Files: {results.get('total_files', 0)}",
@@ -79,23 +105,23 @@ def _format_code_analysis_section(results: Dict) -> List[str]:
         f"🗂️ Classes: {results.get('total_classes', 0)}",
         f"📝 Lines of Code: {results.get('total_lines', 0)}",
         ""
-    ]
+    ))
 
 
-def _format_security_section(security_results: Dict) -> List[str]:
-    """Format security analysis section."""
+def _format_security_section(lines: List[str], security_results: Dict) -> None:
+    """Append the security analysis section to lines."""
     severity_icons = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🔵"}
     
-    lines = [
+    lines.extend((
         "🔒 SECURITY ANALYSIS",
         "-" * 30,
         f"🚨 Risk Level: {security_results.get('risk_level', 'Unknown')}",
         f"🛡️ Vulnerabilities: {security_results.get('total_vulnerabilities', 0)}",
         ""
-    ]
+    ))
     
     # Vulnerability breakdown
-    counts = security_results.get('vulnerability_counts', {})
+    counts = security_results.get('vulnerability_counts') or _EMPTY
     if any(counts.values()):
         lines.append("Severity Breakdown:")
         for severity in ['critical', 'high', 'medium', 'low']:
@@ -104,16 +130,14 @@ def _format_security_section(security_results: Dict) -> List[str]:
                 icon = severity_icons.get(severity, '⚪')
                 lines.append(f"  {icon} {severity.title()}: {count}")
         lines.append("")
-    
-    return lines
 
 
-def _format_dependency_section(dependency_results: Dict) -> List[str]:
-    """Format dependency analysis section."""
-    lines = [
+def _format_dependency_section(lines: List[str], dependency_results: Dict) -> None:
+    """Append the dependency analysis section to lines."""
+    lines.extend((
         "📦 DEPENDENCY ANALYSIS",
         "-" * 30
-    ]
+    ))
     
     # Handle both new and legacy result formats
     if "stats" in dependency_results:
@@ -126,22 +150,21 @@ def _format_dependency_section(dependency_results: Dict) -> List[str]:
             f"🏠 Local Modules: {stats.get('local', 0)}",
         ])
         
-        risk = dependency_results.get("risk_assessment", {})
+        risk = dependency_results.get("risk_assessment") or _EMPTY
         risk_level = risk.get("risk_level", "UNKNOWN")
         risk_icons = {"MINIMAL": "🟢", "LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴", "CRITICAL": "🔴"}
         icon = risk_icons.get(risk_level, "⚪")
         lines.append(f"{icon} Risk Level: {risk_level}")
     
     lines.append("")
-    return lines
 
 
-def _format_discovery_section(discovery_results: Dict) -> List[str]:
-    """Format codebase discovery section."""
-    lines = [
+def _format_discovery_section(lines: List[str], discovery_results: Dict) -> None:
+    """Append the codebase discovery section to lines."""
+    lines.extend((
         "🗺️ CODEBASE DISCOVERY",
         "-" * 30
-    ]
+    ))
     
     # Entry points
     entry_points = discovery_results.get("entry_points", [])
@@ -154,7 +177,7 @@ def _format_discovery_section(discovery_results: Dict) -> List[str]:
             lines.append(f"  • {filename} ({conf_str} confidence)")
     
     # Frameworks
-    frameworks = discovery_results.get("framework_detection", {})
+    frameworks = discovery_results.get("framework_detection") or _EMPTY
     if frameworks:
         lines.append("\n🔧 Frameworks Detected:")
         for fw, conf in frameworks.items():
@@ -162,46 +185,46 @@ def _format_discovery_section(discovery_results: Dict) -> List[str]:
             lines.append(f"  • {fw.title()}: {conf_str}")
     
     lines.append("")
-    return lines
 
 
-def _format_git_section(git_results: Dict) -> List[str]:
-    """Format git analysis section."""
+def _format_git_section(lines: List[str], git_results: Dict) -> None:
+    """Append the git analysis section to lines."""
     if not git_results.get("is_repo", False):
-        return ["📊 GIT REPOSITORY: Not a git repository", ""]
+        lines.extend(("📊 GIT REPOSITORY: Not a git repository", ""))
+        return
     
-    return [
+    lines.extend((
         "📊 GIT REPOSITORY INFO",
         "-" * 30,
         f"🌿 Branch: {git_results.get('current_branch', 'unknown')}",
-        f"📝 Modified Files: {len(git_results.get('modified_files', []))}",
-        f"📋 Staged Files: {len(git_results.get('staged_files', []))}",
+        f"📝 Modified Files: {len(git_results.get('modified_files', ()))}",
+        f"📋 Staged Files: {len(git_results.get('staged_files', ()))}",
         ""
-    ]
+    ))
 
 
-def _format_recommendations(issues: List[Any]) -> List[str]:
-    """Format recommendations based on issues found."""
+def _format_recommendations(lines: List[str], issues: List[Any]) -> None:
+    """Append recommendations based on issues found to lines."""
     if len(issues) == 0:
-        return [
+        lines.extend((
             "",
             "🎉 CONGRATULATIONS!",
             "No issues were found in your codebase.",
             "Your code appears to be well-structured and follows good practices!",
-        ]
+        ))
+        return
     
-    # Categorize issues by severity
-    critical = sum(1 for issue in issues if getattr(issue, 'severity', '') == 'critical')
-    high = sum(1 for issue in issues if getattr(issue, 'severity', '') == 'high')
-    warnings = sum(1 for issue in issues if getattr(issue, 'severity', '') in ['warning', 'medium'])
+    # Categorize issues by severity in a single pass
+    by_severity = Counter(getattr(issue, 'severity', '') for issue in issues)
+    critical = by_severity['critical']
+    high = by_severity['high']
+    warnings = by_severity['warning'] + by_severity['medium']
     
-    lines = ["", "💡 NEXT STEPS:"]
+    lines.extend(("", "💡 NEXT STEPS:"))
     if critical > 0:
         lines.append(f"  🔴 Address {critical} critical security issues immediately")
     if high > 0:
         lines.append(f"  🟠 Review {high} high-priority issues")  
     if warnings > 0:
         lines.append(f"  🟡 Consider fixing {warnings} warnings for better code quality")
-    lines.append("  📊 Check the Issues tab for detailed information")
-    
-    return lines
\ No newline at end of file
+    lines.append("  📊 Check the Issues tab for detailed information")
\ No newline at end of file
@@ -9,8 +9,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Pattern
 from dataclasses import dataclass
 
+from functions._fswalk import iter_py_files
+
 from utils.security_patterns import COMPILED_PATTERNS
 
+# Path substrings of directories that are never scanned
+_SKIP_DIRS = ('__pycache__', '.git', '.venv', 'venv', 'env', 'test')
+
 @dataclass
 class SecurityIssue:
     """Security vulnerability found in code."""
@@ -41,7 +46,10 @@ class SecurityScanner:
             raise FileNotFoundError(f"Project path not found: {project_path}")
         
         # Find Python files to scan
-        python_files = [f for f in path.rglob("*.py") if self._should_scan(f)]
+        python_files = [
+            f for f in map(Path, iter_py_files(str(path), _SKIP_DIRS))
+            if self._should_scan(f)
+        ]
         
         if not python_files:
             return self._empty_results()
@@ -66,8 +74,7 @@ class SecurityScanner:
             return False
         
         # Skip common directories
-        skip_dirs = {'__pycache__', '.git', '.venv', 'venv', 'env', 'test'}
-        if any(skip_dir in file_str for skip_dir in skip_dirs):
+        if any(skip_dir in file_str for skip_dir in _SKIP_DIRS):
             return False
             
         return True
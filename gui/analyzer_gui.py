@@ -91,6 +91,11 @@ class CodeAnalyzerGUI(tk.Tk):
         self.status_bar.set_text(f"Analysis complete - {issue_count} issues found")
         self.status_bar.set_info(f"Modules: {modules_used}")
 
+    def destroy(self):
+        """Stop any background analysis before the window goes away."""
+        self.controller.shutdown()
+        super().destroy()
+
 
 def create_app(project_path: Optional[Path] = None) -> CodeAnalyzerGUI:
     """Create and return the GUI application."""
@@ -42,8 +42,7 @@ def handle_cli() -> int:
     """Handle CLI mode - delegate to CLI module."""
     try:
         from cli.command_handler import CLIHandler
-        handler = CLIHandler()
-        return handler.execute(sys.argv[1:])
+        return CLIHandler.execute(sys.argv[1:])
     except ImportError:
         print("❌ CLI module not available")
         return 1